@@ -5,48 +5,138 @@ CFAR Framework Command Line Interface
 """
 
 import argparse
+import math
 import yaml
 import numpy as np
 import json
 import csv
+import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 
 from resolution_engine.state import State
-from resolution_engine.dynamics import step
+from resolution_engine.dynamics import step_array
 from resolution_engine.estimator import estimate_na_eff, estimate_lambda_eff, estimate_k1, min_resolvable_deltaY
 from resolution_engine.controller_pid import PID
-from resolution_engine.controller_bandit import ThompsonBandit
+from resolution_engine.controller_bandit import ThompsonBandit, EnsembleThompsonBandit
 from resolution_engine.controller_fluctuation import FluctuationController
+from resolution_engine.simulator import simulate
+from resolution_engine._compat import NUMBA_AVAILABLE
 
+# Prefer the libyaml C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
-def run(path: str, output_file: str = None, output_format: str = "json"):
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import pyarrow for Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Column order for flattened CSV output
+CSV_COLUMNS = ('day', 'Y', 'N', 'A', 'C', 'B', 'NA_eff', 'lambda_eff', 'k1', 'delta_Y_min',
+               'error', 'uC', 'uA', 'selected_arm', 'arm_name', 'reward')
+
+# Preallocated per-day record layout (control_mode stored as a fluctuation flag,
+# arm_name recovered from selected_arm)
+SIM_DTYPE = np.dtype([
+    ('day', 'i4'), ('Y', 'f8'), ('N', 'f8'), ('A', 'f8'), ('C', 'f8'), ('B', 'f8'),
+    ('NA_eff', 'f8'), ('lambda_eff', 'f8'), ('k1', 'f8'), ('delta_Y_min', 'f8'),
+    ('error', 'f8'), ('uC', 'f8'), ('uA', 'f8'), ('uF', 'f8'),
+    ('selected_arm', 'i4'), ('fluctuation', 'i1'), ('reward', 'f8')
+])
+
+
+def run(path: str, output_file: str = None, output_format: str = "json", stream: bool = False,
+        quiet: bool = False, log_every: int = 1):
     """
     Run CFAR Framework simulation with specified configuration
     
     Args:
         path: Path to configuration YAML file
         output_file: Optional output file path for results
-        output_format: Output format ('json', 'csv', 'yaml')
+        output_format: Output format ('json', 'csv', 'yaml', 'parquet')
+        stream: Write each day to output_file as it is simulated instead of keeping
+            simulation_data in memory (json and csv only; results then omit it)
+        quiet: Suppress all console output
+        log_every: Print a progress line every N days (0 disables day lines)
     """
     # Load configuration
-    cfg = yaml.safe_load(open(path))
+    with open(path) as f:
+        cfg = yaml.load(f, Loader=YamlLoader)
+    
+    return run_config(cfg, output_file, output_format, stream, quiet, log_every, config_file=path)
+
+
+def load_json_config(source: str) -> Dict[str, Any]:
+    """
+    Load a configuration given as JSON (same layout as the YAML files)
+    
+    Args:
+        source: Path to a JSON file, or '-' to read it from stdin
     
+    Returns:
+        Configuration dictionary
+    """
+    data = sys.stdin.buffer.read() if source == "-" else Path(source).read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def run_config(cfg: Dict[str, Any], output_file: str = None, output_format: str = "json",
+               stream: bool = False, quiet: bool = False, log_every: int = 1,
+               config_file: str = None) -> Dict[str, Any]:
+    """
+    Run CFAR Framework simulation from an already-loaded configuration
+    
+    Args:
+        cfg: Configuration dictionary (same layout as the YAML files)
+        output_file: Optional output file path for results
+        output_format: Output format ('json', 'csv', 'yaml', 'parquet')
+        stream: Write each day to output_file as it is simulated (see run)
+        quiet: Suppress all console output
+        log_every: Print a progress line every N days (0 disables day lines)
+        config_file: Source path recorded in the results metadata, if any
+    
+    Returns:
+        Simulation results dictionary
+    """
     # Initialize system state
     s = State(**cfg["init_state"])
     
     # Initialize controllers
+    rng = np.random.default_rng(cfg.get("seed"))  # one generator for noise and bandit sampling
     pid = PID(**cfg["pid"])
-    bandit = ThompsonBandit(n_arms=len(cfg["fast_arms"]))
+    ensemble_size = cfg.get("bandit", {}).get("ensemble_size")
+    if ensemble_size:
+        bandit = EnsembleThompsonBandit(n_arms=len(cfg["fast_arms"]), M=ensemble_size, rng=rng)
+    else:
+        bandit = ThompsonBandit(n_arms=len(cfg["fast_arms"]), rng=rng)
     fluctuation = FluctuationController(**cfg.get("fluctuation", {}))
     
-    # Get target and simulation parameters
+    # Get target and simulation parameters (as locals for the day loop)
     target = cfg["target_Y"]
+    horizon = cfg["horizon_days"]
+    reward_threshold = cfg["reward_threshold"]
+    arm_doses = [arm["dose"] for arm in cfg["fast_arms"]]
+    arm_names = [arm["name"] for arm in cfg["fast_arms"]]
     
-    print(f"Starting CFAR Framework simulation with target Y = {target}")
-    print(f"Initial state: Y={s.Y:.3f}, N={s.N:.3f}, A={s.A:.3f}, C={s.C:.3f}, B={s.B:.3f}")
-    print()
+    if not quiet:
+        print(f"Starting CFAR Framework simulation with target Y = {target}")
+        print(f"Initial state: Y={s.Y:.3f}, N={s.N:.3f}, A={s.A:.3f}, C={s.C:.3f}, B={s.B:.3f}")
+        print()
     
     # Storage for results
     results = {
@@ -54,9 +144,10 @@ def run(path: str, output_file: str = None, output_format: str = "json"):
             "framework": "CFAR Framework",
             "version": "0.1.0",
             "timestamp": datetime.now().isoformat(),
-            "config_file": path,
+            "config_file": config_file,
             "target_Y": target,
             "horizon_days": cfg["horizon_days"],
+            "seed": cfg.get("seed"),
             "initial_state": cfg["init_state"]
         },
         "parameters": {
@@ -70,114 +161,381 @@ def run(path: str, output_file: str = None, output_format: str = "json"):
         },
         "simulation_data": []
     }
+    recorder = RunRecorder(results, target, arm_names, horizon, output_file, output_format,
+                           stream=stream and output_file is not None,
+                           log_every=0 if quiet else log_every)
     
-    # Track state history for fluctuation controller
-    state_history = [s]
+    # Estimate system parameters (loop-invariant unless marked dynamic in the config)
+    dynamic_estimators = cfg.get("dynamic_estimators", False)
+    na = estimate_na_eff(**cfg["na_inputs"])
+    lam = estimate_lambda_eff(**cfg["lambda_inputs"])
+    k1 = estimate_k1(**cfg["k1_inputs"])
+    dYmin = min_resolvable_deltaY(na, lam, k1)
+    na, lam, k1, dYmin = float(na), float(lam), float(k1), float(dYmin)
+    
+    # Presample the outcome noise for the whole horizon
+    eps = rng.standard_normal(horizon) * 0.02
     
     # Run simulation
-    for t in range(cfg["horizon_days"]):
-        # Estimate system parameters
-        na = estimate_na_eff(**cfg["na_inputs"])
-        lam = estimate_lambda_eff(**cfg["lambda_inputs"])
-        k1 = estimate_k1(**cfg["k1_inputs"])
-        dYmin = min_resolvable_deltaY(na, lam, k1)
+    if NUMBA_AVAILABLE and not dynamic_estimators and not ensemble_size:
+        # Compiled fast path: the whole horizon runs in one kernel call
+        traj = simulate(s, horizon, pid, bandit, fluctuation, np.array(arm_doses),
+                        dYmin, target, reward_threshold, eps)
+        traj = {key: values.tolist() for key, values in traj.items()}  # bulk convert to Python scalars
         
-        # Compute control actions with strategy switching
-        e = target - s.Y  # error
+        # Days are recorded as plain (Y, N, A, C, B) tuples; only the final State is built
+        states = zip(traj["Y"], traj["N"], traj["A"], traj["C"], traj["B"])
+        for t, y in enumerate(states):
+            arm = traj["arm"][t]
+            recorder.record(t, y, na, lam, k1, dYmin, traj["error"][t],
+                            "fluctuation" if traj["mode"][t] else "precision",
+                            traj["uC"][t], traj["uA"][t], traj["uF"][t], arm,
+                            arm_names[arm], traj["reward"][t])
+        if horizon:
+            s = State(*y)
+    
+    else:
+        # Per-day Python loop (reference path; also used for dynamic estimators and ensemble bandits)
+        # State is carried as a packed (Y, N, A, C, B) array; State objects are only
+        # built at the boundary for the fluctuation controller and logging.
+        s_arr = s.to_array()
+        fluctuation.observe(s)  # Seed fluctuation trend buffers with the initial state
         
-        # Strategy switching based on Rayleigh criterion
-        if abs(e) < dYmin:
-            # Precision blocked - use fluctuation control
-            uC = 0.0  # Freeze structural adjustments
-            uF = fluctuation(s, t, state_history)
-            control_mode = "fluctuation"
-        else:
-            # Precision feasible - use PID control
-            uC = pid(e, dYmin)  # Structural adjustment
-            uF = 0.0
-            control_mode = "precision"
+        for t in range(horizon):
+            # Re-estimate system parameters only when they may change over the run
+            if dynamic_estimators:
+                na = estimate_na_eff(**cfg["na_inputs"])
+                lam = estimate_lambda_eff(**cfg["lambda_inputs"])
+                k1 = estimate_k1(**cfg["k1_inputs"])
+                dYmin = min_resolvable_deltaY(na, lam, k1)
+                na, lam, k1, dYmin = float(na), float(lam), float(k1), float(dYmin)
+            
+            # Compute control actions with strategy switching
+            e = target - s.Y  # error
+            
+            # Strategy switching based on Rayleigh criterion
+            if abs(e) < dYmin:
+                # Precision blocked - use fluctuation control
+                uC = 0.0  # Freeze structural adjustments
+                uF = fluctuation(s, t)
+                control_mode = "fluctuation"
+            else:
+                # Precision feasible - use PID control
+                uC = pid(e, dYmin)  # Structural adjustment
+                uF = 0.0
+                control_mode = "precision"
+            
+            # Select message/frame using bandit (always active)
+            arm = bandit.select()
+            uA = arm_doses[arm]
+            arm_name = arm_names[arm]
+            
+            # Step system dynamics
+            s_arr = step_array(s_arr, uA=uA, uC=uC, uF=uF, eps=eps[t])
+            y = tuple(s_arr.tolist())
+            s = State(*y)
+            fluctuation.observe(s)
+            
+            # Compute reward for bandit
+            reward = float(s.Y > reward_threshold)  # toy reward
+            bandit.update(arm, reward)
+            
+            recorder.record(t, y, na, lam, k1, dYmin, e, control_mode,
+                            uC, uA, uF, arm, arm_name, reward)
+    
+    # Add summary statistics
+    recorder.summary(s)
+    recorder.close()
+    final_error = results["summary"]["final_error"]
+    
+    if not quiet:
+        print()
+        print(f"Final state: Y={s.Y:.3f} (target: {target})")
+        print(f"Final error: {final_error:.3f}")
+        print(f"Days above target: {results['summary']['days_above_target']}/{horizon}")
+        print(f"Max Y achieved: {results['summary']['max_Y_achieved']:.3f}")
+    
+    # Save results if output file specified
+    if output_file:
+        if not recorder.streaming:
+            save_results(results, output_file, output_format)
+        if not quiet:
+            print(f"\nResults saved to: {output_file}")
+    
+    return results
+
+
+class RunRecorder:
+    """
+    Collects per-day simulation records and running summary statistics
+    
+    Summary counters are updated as each day is recorded, so building the summary
+    needs no extra pass over the stored days. Days are kept as rows of a preallocated
+    SIM_DTYPE array and only expanded into results["simulation_data"] dicts by close().
+    In streaming mode they are written straight to the output file instead.
+    """
+    
+    def __init__(self, results: Dict[str, Any], target: float, arm_names: List[str], horizon: int,
+                 output_file: str = None, output_format: str = "json", stream: bool = False,
+                 log_every: int = 1):
+        """
+        Initialize recorder
+        
+        Args:
+            results: Results dictionary (metadata and parameters already filled in)
+            target: Target outcome Y
+            arm_names: Bandit arm names, indexed by arm
+            horizon: Number of days that will be recorded
+            output_file: Output file path (required for streaming)
+            output_format: Output format ('json' or 'csv' can be streamed)
+            stream: Write days to output_file as they are recorded
+            log_every: Print a progress line every N days (0 disables them)
+        """
+        self.results = results
+        self.target = target
+        self.arm_names = arm_names
+        self.log_every = log_every
+        
+        # Running summary statistics
+        self.days_above_target = 0
+        self.max_Y = -math.inf
+        self.arm_counts = np.zeros(len(arm_names), dtype=np.int64)
+        self.precision_days = 0
+        self.fluctuation_days = 0
+        self.fluctuation_pulses = 0
+        
+        # Streaming output
+        self.output_path = Path(output_file) if stream else None
+        self.output_format = output_format.lower()
+        self.sim = None if stream else np.zeros(horizon, dtype=SIM_DTYPE)
+        self._file = None
+        self._writer = None
+        self._n_written = 0
+        
+        if self.output_path is not None:
+            del results["simulation_data"]
+            if self.output_format == 'json':
+                self._file = open(self.output_path, 'w')
+                self._file.write('{\n')
+                for key in ("metadata", "parameters"):
+                    self._file.write(f'  "{key}": {_json_nested(results[key], 1)},\n')
+                self._file.write('  "simulation_data": [')
+            elif self.output_format == 'csv':
+                self._file = open(self.output_path, 'w', newline='')
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(CSV_COLUMNS)
+            else:
+                raise ValueError(f"Streaming is only supported for json and csv output, not {output_format}")
+    
+    @property
+    def streaming(self) -> bool:
+        """True when days are written to the output file as they are recorded"""
+        return self.output_path is not None
+    
+    def record(self, t: int, y: Tuple[float, float, float, float, float], na: float, lam: float,
+               k1: float, dYmin: float, e: float, control_mode: str, uC: float, uA: float, uF: float,
+               arm: int, arm_name: str, reward: float):
+        """
+        Record one day of simulation data and print progress
         
-        # Select message/frame using bandit (always active)
-        arm = bandit.select()
-        uA = cfg["fast_arms"][arm]["dose"]
-        arm_name = cfg["fast_arms"][arm]["name"]
+        The day's state is passed as a plain (Y, N, A, C, B) tuple so the loops need not
+        build a State per day. Streamed values are written as given, so callers pass plain
+        Python floats/ints (the json fallback cannot serialize numpy scalars).
+        """
+        Y, N, A, C, B = y
+        if self.sim is not None:
+            self.sim[t] = (t, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA, uF,
+                           arm, control_mode == "fluctuation", reward)
+        elif self._writer is not None:
+            self._writer.writerow((t, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA,
+                                   arm, arm_name, reward))
+        else:
+            timestep_data = _timestep_dict(t, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA, uF,
+                                           arm, control_mode, arm_name, reward)
+            self._file.write(',\n    ' if self._n_written else '\n    ')
+            self._file.write(_json_nested(timestep_data, 2))
+            self._n_written += 1
         
-        # Step system dynamics
-        s = step(s, uA=uA, uC=uC, uF=uF, eps=np.random.normal(0, 0.02))
-        state_history.append(s)
+        # Update running summary statistics
+        if Y >= self.target:
+            self.days_above_target += 1
+        if Y > self.max_Y:
+            self.max_Y = Y
+        self.arm_counts[arm] += 1
+        if control_mode == "precision":
+            self.precision_days += 1
+        else:
+            self.fluctuation_days += 1
+        if uF > 0.01:
+            self.fluctuation_pulses += 1
         
-        # Compute reward for bandit
-        reward = float(s.Y > cfg["reward_threshold"])  # toy reward
-        bandit.update(arm, reward)
+        # Print progress with control mode (using ASCII for Windows compatibility)
+        if not self.log_every or t % self.log_every:
+            return
+        mode_indicator = "F" if control_mode == "fluctuation" else "P"
+        print(f"day {t:03d}  Y={Y:.3f}  N={N:.3f}  A={A:.3f}  C={C:.3f}  B={B:.3f}  dYmin={dYmin:.3f}  uC={uC:+.3f}  uF={uF:+.3f}  [{mode_indicator}]  arm={arm}({arm_name})")
+    
+    def summary(self, s: State) -> Dict[str, Any]:
+        """
+        Build summary statistics from the running counters
         
-        # Store timestep data
-        timestep_data = {
-            "day": t,
-            "state": {
+        Args:
+            s: Final system state
+            
+        Returns:
+            Summary dictionary (stored in results["summary"])
+        """
+        final_error = abs(self.target - s.Y)
+        self.results["summary"] = {
+            "final_state": {
                 "Y": float(s.Y),
                 "N": float(s.N),
                 "A": float(s.A),
                 "C": float(s.C),
                 "B": float(s.B)
             },
-            "parameters": {
-                "NA_eff": float(na),
-                "lambda_eff": float(lam),
-                "k1": float(k1),
-                "delta_Y_min": float(dYmin)
+            "final_error": float(final_error),
+            "target_achieved": bool(final_error < 0.05),  # Within 5% of target
+            "days_above_target": self.days_above_target,
+            "max_Y_achieved": float(self.max_Y),
+            "arm_usage": {name: int(count) for name, count in zip(self.arm_names, self.arm_counts)},
+            "control_mode_usage": {
+                "precision_days": self.precision_days,
+                "fluctuation_days": self.fluctuation_days
             },
-            "control": {
-                "error": float(e),
-                "control_mode": control_mode,
-                "uC": float(uC),
-                "uA": float(uA),
-                "uF": float(uF),
-                "selected_arm": int(arm),
-                "arm_name": arm_name,
-                "reward": float(reward)
-            }
+            "total_fluctuation_pulses": self.fluctuation_pulses
         }
-        results["simulation_data"].append(timestep_data)
-        
-        # Print progress with control mode (using ASCII for Windows compatibility)
-        mode_indicator = "F" if control_mode == "fluctuation" else "P"
-        print(f"day {t:03d}  Y={s.Y:.3f}  N={s.N:.3f}  A={s.A:.3f}  C={s.C:.3f}  B={s.B:.3f}  dYmin={dYmin:.3f}  uC={uC:+.3f}  uF={uF:+.3f}  [{mode_indicator}]  arm={arm}({arm_name})")
+        return self.results["summary"]
     
-    # Add summary statistics
-    final_error = abs(target - s.Y)
-    results["summary"] = {
-        "final_state": {
-            "Y": float(s.Y),
-            "N": float(s.N),
-            "A": float(s.A),
-            "C": float(s.C),
-            "B": float(s.B)
-        },
-        "final_error": float(final_error),
-        "target_achieved": bool(final_error < 0.05),  # Within 5% of target
-        "days_above_target": sum(1 for day in results["simulation_data"] if day["state"]["Y"] >= target),
-        "max_Y_achieved": max(day["state"]["Y"] for day in results["simulation_data"]),
-        "arm_usage": {arm["name"]: sum(1 for day in results["simulation_data"] if day["control"]["arm_name"] == arm["name"]) 
-                     for arm in cfg["fast_arms"]},
-        "control_mode_usage": {
-            "precision_days": sum(1 for day in results["simulation_data"] if day["control"]["control_mode"] == "precision"),
-            "fluctuation_days": sum(1 for day in results["simulation_data"] if day["control"]["control_mode"] == "fluctuation")
-        },
-        "total_fluctuation_pulses": sum(1 for day in results["simulation_data"] if day["control"]["uF"] > 0.01)
+    def close(self):
+        """
+        Finish recording: expand the stored rows into results["simulation_data"], or
+        finish the streamed output file (summary and any metadata file)
+        """
+        if self.sim is not None:
+            self.results["simulation_data"] = [
+                _timestep_dict(day, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA, uF, arm,
+                               "fluctuation" if fluct else "precision", self.arm_names[arm], reward)
+                for (day, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA, uF, arm, fluct, reward)
+                in self.sim.tolist()
+            ]
+            self.sim = None
+            return
+        
+        if self._file is None:
+            return
+        
+        if self._writer is None:
+            self._file.write('\n  ],\n' if self._n_written else '],\n')
+            self._file.write(f'  "summary": {_json_nested(self.results["summary"], 1)}\n}}')
+        else:
+            write_csv_metadata(self.results, self.output_path)
+        
+        self._file.close()
+        self._file = None
+
+
+def _timestep_dict(day, Y, N, A, C, B, na, lam, k1, dYmin, e, uC, uA, uF,
+                   arm, control_mode, arm_name, reward) -> Dict[str, Any]:
+    """Build one day's entry of results["simulation_data"]"""
+    return {
+        "day": day,
+        "state": {"Y": Y, "N": N, "A": A, "C": C, "B": B},
+        "parameters": {"NA_eff": na, "lambda_eff": lam, "k1": k1, "delta_Y_min": dYmin},
+        "control": {
+            "error": e,
+            "control_mode": control_mode,
+            "uC": uC,
+            "uA": uA,
+            "uF": uF,
+            "selected_arm": arm,
+            "arm_name": arm_name,
+            "reward": reward
+        }
     }
+
+
+def dump_json(obj: Any, path: Path):
+    """
+    Write obj to path as indent=2 JSON, using orjson when it is installed
+    
+    Args:
+        obj: JSON-serializable object (numpy scalars/arrays allowed with orjson)
+        path: Output file path
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def _json_nested(obj: Any, level: int) -> str:
+    """Serialize obj with indent=2 as it appears nested `level` levels deep in the results file"""
+    if ORJSON_AVAILABLE:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    else:
+        text = json.dumps(obj, indent=2)
+    return text.replace('\n', '\n' + '  ' * level)
+
+
+def _csv_row(d: Dict[str, Any]) -> tuple:
+    """Flatten one day of simulation data into a tuple in CSV_COLUMNS order"""
+    return (d['day'], d['state']['Y'], d['state']['N'], d['state']['A'], d['state']['C'], d['state']['B'],
+            d['parameters']['NA_eff'], d['parameters']['lambda_eff'], d['parameters']['k1'],
+            d['parameters']['delta_Y_min'], d['control']['error'], d['control']['uC'], d['control']['uA'],
+            d['control']['selected_arm'], d['control']['arm_name'], d['control']['reward'])
+
+
+def write_csv_metadata(results: Dict[str, Any], output_path: Path):
+    """
+    Save metadata and summary next to a CSV results file
+    
+    Args:
+        results: Simulation results dictionary
+        output_path: Path of the CSV results file
+    """
+    metadata_path = output_path.with_name(f"{output_path.stem}_metadata.json")
+    dump_json({
+        "metadata": results["metadata"],
+        "parameters": results["parameters"],
+        "summary": results["summary"]
+    }, metadata_path)
+
+
+def _flat_columns(simulation_data: List[Dict[str, Any]]) -> Dict[str, list]:
+    """
+    Flatten per-day records into columns named like pd.json_normalize(sep='_')
+    (day, state_Y, parameters_NA_eff, control_uF, ...)
+    """
+    columns = {"day": [d["day"] for d in simulation_data]}
+    if simulation_data:
+        for group in ("state", "parameters", "control"):
+            for key in simulation_data[0][group]:
+                columns[f"{group}_{key}"] = [d[group][key] for d in simulation_data]
+    return columns
+
+
+def write_parquet(results: Dict[str, Any], output_path: Path):
+    """
+    Save simulation data as a flat zstd-compressed Parquet table
     
-    print()
-    print(f"Final state: Y={s.Y:.3f} (target: {target})")
-    print(f"Final error: {final_error:.3f}")
-    print(f"Days above target: {results['summary']['days_above_target']}/{cfg['horizon_days']}")
-    print(f"Max Y achieved: {results['summary']['max_Y_achieved']:.3f}")
+    Metadata, parameters and summary are stored as JSON under the b"cfar" key of the
+    table's schema metadata, so the file is self-contained.
     
-    # Save results if output file specified
-    if output_file:
-        save_results(results, output_file, output_format)
-        print(f"\nResults saved to: {output_file}")
+    Args:
+        results: Simulation results dictionary
+        output_path: Output file path
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet output. Install with: pip install pyarrow")
     
-    return results
+    table = pa.Table.from_pydict(_flat_columns(results["simulation_data"]))
+    meta = {key: results[key] for key in ("metadata", "parameters", "summary")}
+    meta_json = orjson.dumps(meta) if ORJSON_AVAILABLE else json.dumps(meta).encode()
+    table = table.replace_schema_metadata({b"cfar": meta_json})
+    pq.write_table(table, output_path, compression="zstd")
 
 
 def save_results(results: Dict[str, Any], output_file: str, output_format: str):
@@ -187,66 +545,53 @@ def save_results(results: Dict[str, Any], output_file: str, output_format: str):
     Args:
         results: Simulation results dictionary
         output_file: Output file path
-        output_format: Format ('json', 'csv', 'yaml')
+        output_format: Format ('json', 'csv', 'yaml', 'parquet')
     """
     output_path = Path(output_file)
     
     if output_format.lower() == 'json':
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        dump_json(results, output_path)
     
     elif output_format.lower() == 'csv':
-        # Flatten simulation data for CSV
-        csv_data = []
-        for day_data in results["simulation_data"]:
-            row = {
-                'day': day_data['day'],
-                'Y': day_data['state']['Y'],
-                'N': day_data['state']['N'],
-                'A': day_data['state']['A'],
-                'C': day_data['state']['C'],
-                'B': day_data['state']['B'],
-                'NA_eff': day_data['parameters']['NA_eff'],
-                'lambda_eff': day_data['parameters']['lambda_eff'],
-                'k1': day_data['parameters']['k1'],
-                'delta_Y_min': day_data['parameters']['delta_Y_min'],
-                'error': day_data['control']['error'],
-                'uC': day_data['control']['uC'],
-                'uA': day_data['control']['uA'],
-                'selected_arm': day_data['control']['selected_arm'],
-                'arm_name': day_data['control']['arm_name'],
-                'reward': day_data['control']['reward']
-            }
-            csv_data.append(row)
-        
+        # Flatten simulation data for CSV, one tuple per day in CSV_COLUMNS order
         with open(output_path, 'w', newline='') as f:
-            if csv_data:
-                writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-                writer.writeheader()
-                writer.writerows(csv_data)
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(_csv_row(d) for d in results["simulation_data"])
                 
         # Also save metadata and summary as separate files
-        metadata_path = output_path.with_name(f"{output_path.stem}_metadata.json")
-        with open(metadata_path, 'w') as f:
-            json.dump({
-                "metadata": results["metadata"],
-                "parameters": results["parameters"],
-                "summary": results["summary"]
-            }, f, indent=2)
+        write_csv_metadata(results, output_path)
     
     elif output_format.lower() == 'yaml':
         with open(output_path, 'w') as f:
-            yaml.dump(results, f, default_flow_style=False, indent=2)
+            yaml.dump(results, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
+    
+    elif output_format.lower() == 'parquet':
+        write_parquet(results, output_path)
 
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser(description="CFAR Framework CLI")
     ap.add_argument("command", choices=["run"], help="Command to execute")
-    ap.add_argument("--config", required=True, help="Path to configuration YAML file")
+    config_source = ap.add_mutually_exclusive_group(required=True)
+    config_source.add_argument("--config", help="Path to configuration YAML file")
+    config_source.add_argument("--config-json", metavar="PATH",
+                               help="Configuration as JSON, from a file or '-' for stdin")
     ap.add_argument("--output", "-o", help="Output file path for results")
-    ap.add_argument("--format", "-f", choices=["json", "csv", "yaml"], default="json", 
+    ap.add_argument("--format", "-f", choices=["json", "csv", "yaml", "parquet"], default="json", 
                     help="Output format (default: json)")
+    ap.add_argument("--stream", action="store_true",
+                    help="Write days to the output file as they are simulated (json/csv)")
+    ap.add_argument("--quiet", "-q", action="store_true", help="Suppress console output")
+    ap.add_argument("--log-every", type=int, default=1,
+                    help="Print a progress line every N days (default: 1, 0 disables)")
     args = ap.parse_args()
     
     if args.command == "run":
-        run(args.config, args.output, args.format)
+        if args.config_json:
+            cfg = load_json_config(args.config_json)
+            config_file = None if args.config_json == "-" else args.config_json
+            run_config(cfg, args.output, args.format, args.stream, args.quiet, args.log_every,
+                       config_file=config_file)
+        else:
+            run(args.config, args.output, args.format, args.stream, args.quiet, args.log_every)
@@ -9,7 +9,8 @@ from resolution_engine.controller_fluctuation import FluctuationController
 from resolution_engine.dynamics import gradient_strength
 
 # Load config
-cfg = yaml.safe_load(open("configs/littering.yml"))
+with open("configs/littering.yml") as f:
+    cfg = yaml.safe_load(f)
 
 # Create test states
 early_state = State(Y=0.85, N=0.7, A=0.6, C=0.15, B=0.07)  # Early in simulation
@@ -46,11 +47,13 @@ state_history = [
 ]
 
 for day in range(len(state_history)):
+    state = state_history[day]
+    fluctuation.observe(state)
+    
     if day < 3:
         continue
         
-    state = state_history[day]
-    uF = fluctuation(state, day, state_history[:day+1])
+    uF = fluctuation(state, day)
     
     # Calculate trends manually for debug
     Y_values = [s.Y for s in state_history[max(0, day-5):day+1]]
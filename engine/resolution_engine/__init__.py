@@ -8,15 +8,17 @@ __version__ = "0.1.0"
 __author__ = "CFAR Framework Team"
 
 # Core imports
-from .state import *
-from .dynamics import *
-from .estimator import *
+from .state import State, StateBuffer, StateTransition
+from .dynamics import (sigma, step, step_array, simulate_open_loop,
+                       simulate_open_loop_batch, gradient_strength, cost,
+                       SystemDynamics)
+from .estimator import (estimate_na_eff, estimate_lambda_eff, estimate_k1,
+                        min_resolvable_deltaY, ParameterEstimator)
 
 # Controller imports
-from .controller_pid import *
-from .controller_bandit import *
+from .controller_pid import PID, PIDController
+from .controller_bandit import (ThompsonBandit, EnsembleThompsonBandit, ContextualBandit,
+                                ThompsonSampling, LinUCB)
 
-# System imports
-from .guardrails import *
-from .planner import *
-from .io import *
+# System stubs (guardrails, planner, io) are not loaded here; import them from
+# their submodules, e.g. `from resolution_engine.guardrails import GuardrailSystem`
@@ -0,0 +1,34 @@
+"""
+Ahead-of-Time Kernel Build
+
+# `python -m resolution_engine._aot_build` → resolution_engine/cfar_native extension
+"""
+
+from pathlib import Path
+from numba.pycc import CC
+
+from .dynamics import gradient_strength_kernel, step_scalar_kernel, step_kernel, simulate_trajectory
+from .controller_pid import pid_kernel
+from .controller_fluctuation import ols_slope, fluctuation_kernel
+
+cc = CC("cfar_native")
+cc.output_dir = str(Path(__file__).parent)
+
+# Export the same kernel sources the JIT path uses (py_func is the undecorated function)
+cc.export("gradient_strength_kernel", "f8(f8, f8, f8, f8, f8)")(gradient_strength_kernel.py_func)
+cc.export("step_scalar_kernel",
+          "UniTuple(f8, 5)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)"
+          )(step_scalar_kernel.py_func)
+cc.export("step_kernel", "f8[:](f8[:], f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)")(step_kernel.py_func)
+cc.export("simulate_trajectory",
+          "UniTuple(f8[:], 5)(f8, f8, f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8, f8, f8, f8, f8, f8, f8, f8, f8)"
+          )(simulate_trajectory.py_func)
+cc.export("pid_kernel", "UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)")(pid_kernel.py_func)
+cc.export("ols_slope", "f8(f8[:], i8, i8)")(ols_slope.py_func)
+cc.export("fluctuation_kernel",
+          "Tuple((f8, f8, b1, f8))(f8[:], f8[:], i8, i8, f8, f8, f8, f8, f8)")(fluctuation_kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
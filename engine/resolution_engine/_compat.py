@@ -0,0 +1,38 @@
+"""
+Optional Dependency Shims
+
+# numba JIT with pure-Python fallback, AOT-compiled kernels
+"""
+
+# Try to import numba for compiled kernels
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    vectorize = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Try to import the ahead-of-time compiled kernels (built by `python -m resolution_engine._aot_build`)
+try:
+    from . import cfar_native
+except ImportError:
+    cfar_native = None
+
+
+def native(name, fallback):
+    """
+    Return the AOT-compiled kernel `name` if cfar_native is built, else `fallback`
+    
+    The AOT extension needs no JIT warm-up and runs without numba installed.
+    """
+    if cfar_native is not None:
+        return getattr(cfar_native, name)
+    return fallback
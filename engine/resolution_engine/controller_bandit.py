@@ -9,12 +9,25 @@ from typing import List, Dict, Any, Optional
 from .state import State
 
 
+# Below this many arms a plain Python max over a list beats np.argmax's dispatch overhead
+SMALL_ARGMAX = 64
+
+
+def argmax(values: np.ndarray) -> int:
+    """Index of the first maximum of a 1-D array (np.argmax semantics)"""
+    if values.shape[0] < SMALL_ARGMAX:
+        samples = values.tolist()
+        return samples.index(max(samples))
+    return int(np.argmax(values))
+
+
 class ThompsonBandit:
     """
     Thompson Sampling bandit implementation
     """
     
-    def __init__(self, n_arms: int, prior_alpha: float = 1.0, prior_beta: float = 1.0):
+    def __init__(self, n_arms: int, prior_alpha: float = 1.0, prior_beta: float = 1.0,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialize Thompson Sampling bandit
         
@@ -22,10 +35,16 @@ class ThompsonBandit:
             n_arms: Number of available arms/actions
             prior_alpha: Prior alpha parameter for Beta distribution
             prior_beta: Prior beta parameter for Beta distribution
+            rng: Random generator for posterior draws (defaults to a fresh default_rng())
         """
         self.n_arms = n_arms
         self.a = np.ones(n_arms) * prior_alpha  # Success counts + prior
         self.b = np.ones(n_arms) * prior_beta   # Failure counts + prior
+        self.rng = rng if rng is not None else np.random.default_rng()
+        
+        # Scratch buffers for the Gamma draws (reused on every select)
+        self._g1 = np.empty(n_arms)
+        self._g2 = np.empty(n_arms)
 
     def select(self) -> int:
         """
@@ -34,8 +53,12 @@ class ThompsonBandit:
         Returns:
             Selected arm index
         """
-        # Sample from posterior Beta distributions and select highest
-        return np.argmax(np.random.beta(self.a, self.b))
+        # Beta(a, b) sample = G1 / (G1 + G2) with G1 ~ Gamma(a), G2 ~ Gamma(b)
+        g1 = self.rng.standard_gamma(self.a, out=self._g1)
+        g2 = self.rng.standard_gamma(self.b, out=self._g2)
+        np.add(g1, g2, out=g2)
+        np.divide(g1, g2, out=g1)
+        return argmax(g1)
 
     def update(self, arm: int, reward: float):
         """
@@ -49,6 +72,53 @@ class ThompsonBandit:
         self.b[arm] += (1 - reward)
 
 
+class EnsembleThompsonBandit(ThompsonBandit):
+    """
+    Ensemble sampling variant of Thompson Sampling for large arm catalogs
+    
+    Keeps M posterior draws per arm instead of redrawing every arm on each select.
+    Selection picks one ensemble member at random and plays its best arm; an update
+    only redraws the M samples of the arm that was played.
+    """
+    
+    def __init__(self, n_arms: int, M: int = 8, prior_alpha: float = 1.0, prior_beta: float = 1.0,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Initialize ensemble Thompson bandit
+        
+        Args:
+            n_arms: Number of available arms/actions
+            M: Number of ensemble members (posterior draws kept per arm)
+            prior_alpha: Prior alpha parameter for Beta distribution
+            prior_beta: Prior beta parameter for Beta distribution
+            rng: Random generator for posterior draws (defaults to a fresh default_rng())
+        """
+        super().__init__(n_arms, prior_alpha, prior_beta, rng)
+        self.M = M
+        self.ens = self.rng.beta(self.a, self.b, size=(M, n_arms))
+    
+    def select(self) -> int:
+        """
+        Select arm using a randomly chosen ensemble member
+        
+        Returns:
+            Selected arm index
+        """
+        m = self.rng.integers(self.M)
+        return argmax(self.ens[m])
+    
+    def update(self, arm: int, reward: float):
+        """
+        Update bandit model and redraw the played arm's ensemble samples
+        
+        Args:
+            arm: Selected arm index
+            reward: Observed reward (0 or 1)
+        """
+        super().update(arm, reward)
+        self.ens[:, arm] = self.rng.beta(self.a[arm], self.b[arm], size=self.M)
+
+
 class ContextualBandit:
     """
     Contextual bandit controller with fairness considerations
@@ -7,7 +7,64 @@ Fluctuation Controller Module
 import numpy as np
 from typing import Dict, Any, List, Optional
 from .state import State
-from .dynamics import gradient_strength
+from .dynamics import gradient_strength_kernel
+from ._compat import njit, native, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def ols_slope(values, end, n):
+    """
+    Closed-form least-squares slope of values[end-n:end] against x = 0..n-1
+    
+    With x = arange(n) the x-sums are constants: sum(x) = n(n-1)/2 and
+    sum(x^2) = n(n-1)(2n-1)/6, so only sum(y) and sum(x*y) depend on the data.
+    """
+    sx = n * (n - 1) / 2.0
+    sxx = n * (n - 1) * (2 * n - 1) / 6.0
+    sy = 0.0
+    sxy = 0.0
+    for k in range(n):
+        v = values[end - n + k]
+        sy += v
+        sxy += k * v
+    return (n * sxy - sx * sy) / (n * sxx - sx * sx)
+
+
+@njit(cache=True)
+def fluctuation_kernel(Y_buf, C_buf, end, n, A, C, B, A_threshold, stall_threshold):
+    """
+    Fused trend and attention-trap check over Y_buf/C_buf[end-n:end] in a single pass
+    
+    Both slopes use the same closed form as ols_slope, accumulated in one loop.
+    
+    Returns:
+        Tuple (dY_dt, dC_dt, trap, g) where g is the gradient strength (0.0 without a trap)
+    """
+    sx = n * (n - 1) / 2.0
+    sxx = n * (n - 1) * (2 * n - 1) / 6.0
+    syY = 0.0
+    sxyY = 0.0
+    syC = 0.0
+    sxyC = 0.0
+    for k in range(n):
+        y = Y_buf[end - n + k]
+        c = C_buf[end - n + k]
+        syY += y
+        sxyY += k * y
+        syC += c
+        sxyC += k * c
+    dY_dt = (n * sxyY - sx * syY) / (n * sxx - sx * sx)
+    dC_dt = (n * sxyC - sx * syC) / (n * sxx - sx * sx)
+    
+    # Attention trap: high A + flat dY/dt + declining (or very low) C
+    trap = A > A_threshold and abs(dY_dt) < stall_threshold and (dC_dt < -0.01 or C < 0.1)
+    g = gradient_strength_kernel(A, C, B, dY_dt, 0.8) if trap else 0.0
+    return dY_dt, dC_dt, trap, g
+
+
+# Prefer the ahead-of-time compiled kernels (no JIT warm-up) when they have been built
+_ols_slope = native("ols_slope", ols_slope)
+_fluctuation_kernel = native("fluctuation_kernel", fluctuation_kernel)
 
 
 class FluctuationController:
@@ -39,6 +96,28 @@ class FluctuationController:
         self.last_fire_day = -999
         self.history = []
         
+        # Ring buffers of recent Y/C observations (last `history_size` days). Each value
+        # is written twice, at idx and idx + history_size, so the most recent n values
+        # are always the contiguous slice [idx + history_size - n, idx + history_size).
+        self.history_size = 10
+        self._Y_buf = np.zeros(2 * self.history_size)
+        self._C_buf = np.zeros(2 * self.history_size)
+        self._len = 0
+        self._idx = 0
+    
+    def observe(self, state: State):
+        """
+        Record a system state in the trend buffers
+        
+        Args:
+            state: Latest system state (call once per day, including the initial state)
+        """
+        i = self._idx
+        self._Y_buf[i] = self._Y_buf[i + self.history_size] = state.Y
+        self._C_buf[i] = self._C_buf[i + self.history_size] = state.C
+        self._idx = (i + 1) % self.history_size
+        self._len = min(self._len + 1, self.history_size)
+        
     def detect_attention_trap(self, state: State, dY_dt: float, C_trend: float) -> bool:
         """
         Detect attention trap: high A + flat dY/dt + declining C
@@ -58,31 +137,23 @@ class FluctuationController:
         return high_attention and stalled_progress and declining_structure
     
     def calculate_slope(self, values: List[float], window: int = 7) -> float:
-        """Calculate slope of recent values using linear regression"""
-        if len(values) < 2:
-            return 0.0
-            
-        recent = values[-min(window, len(values)):]
-        if len(recent) < 2:
+        """Calculate slope of recent values using closed-form linear regression"""
+        n = min(window, len(values))
+        if n < 2:
             return 0.0
             
-        x = np.arange(len(recent))
-        y = np.array(recent)
-        
-        # Simple linear regression
-        if len(x) > 1:
-            slope = np.polyfit(x, y, 1)[0]
-            return slope
-        return 0.0
+        recent = np.asarray(values[-n:], dtype=np.float64)
+        return _ols_slope(recent, n, n)
     
-    def __call__(self, state: State, day: int, state_history: List[State]) -> float:
+    def __call__(self, state: State, day: int) -> float:
         """
         Compute fluctuation control output
         
+        Trends are taken from the states recorded with observe().
+        
         Args:
             state: Current system state
             day: Current simulation day
-            state_history: History of system states
             
         Returns:
             Fluctuation control signal uF
@@ -91,25 +162,21 @@ class FluctuationController:
         if day - self.last_fire_day < self.cooldown_days:
             return 0.0
             
-        # Calculate recent trends
-        if len(state_history) < 3:
+        # Need a few observations before trends are meaningful
+        if self._len < 3:
             return 0.0
             
-        Y_values = [s.Y for s in state_history[-10:]]  # Last 10 days
-        C_values = [s.C for s in state_history[-10:]]
-        
-        dY_dt = self.calculate_slope(Y_values, window=5)
-        dC_dt = self.calculate_slope(C_values, window=5)
-        
-        # Check for attention trap
-        attention_trap = self.detect_attention_trap(state, dY_dt, dC_dt)
+        # Recent trends, attention trap check and gradient strength in one pass
+        window = min(5, self._len)
+        end = self._idx + self.history_size
+        dY_dt, dC_dt, attention_trap, g = _fluctuation_kernel(
+            self._Y_buf, self._C_buf, end, window, state.A, state.C, state.B,
+            self.A_threshold, self.stall_threshold
+        )
         
         if not attention_trap:
             return 0.0
             
-        # Calculate gradient strength potential
-        g = gradient_strength(state, dY_dt)
-        
         # Scale by available headroom and system capacity
         attention_headroom = min(1.0, state.A / self.A_threshold)
         burden_guard = max(0.0, 0.8 - state.B)  # Reduce if burden high
@@ -131,6 +198,82 @@ class FluctuationController:
             "cooldown_remaining": max(0, self.cooldown_days - (day - self.last_fire_day)),
             "ready_to_fire": (day - self.last_fire_day) >= self.cooldown_days
         }
+    
+    def to_jit(self) -> "FluctuationJit":
+        """
+        Copy parameters, cooldown state and trend buffers into a FluctuationJit
+        
+        Returns:
+            FluctuationJit instance for use inside @njit code (requires numba)
+        """
+        if FluctuationJit is None:
+            raise ImportError("numba is required for FluctuationJit")
+        fc = FluctuationJit(self.max_uF, self.cooldown_days, self.A_threshold,
+                            self.stall_threshold, self.history_size)
+        fc.last_fire_day = self.last_fire_day
+        fc._Y_buf[:] = self._Y_buf
+        fc._C_buf[:] = self._C_buf
+        fc._len = self._len
+        fc._idx = self._idx
+        return fc
+
+
+if NUMBA_AVAILABLE:
+    from numba import float64, int64
+    from numba.experimental import jitclass
+
+    @jitclass([
+        ('max_uF', float64), ('cooldown_days', int64), ('A_threshold', float64),
+        ('stall_threshold', float64), ('last_fire_day', int64), ('history_size', int64),
+        ('_Y_buf', float64[:]), ('_C_buf', float64[:]), ('_len', int64), ('_idx', int64)
+    ])
+    class FluctuationJit:
+        """
+        nopython-mode FluctuationController (same ring buffers and firing rule)
+        
+        Can be passed into and mutated inside @njit loops. jitclasses are compiled per
+        process (no on-disk cache), so the CLI keeps using fluctuation_kernel directly.
+        """
+        
+        def __init__(self, max_uF, cooldown_days, A_threshold, stall_threshold, history_size):
+            self.max_uF = max_uF
+            self.cooldown_days = cooldown_days
+            self.A_threshold = A_threshold
+            self.stall_threshold = stall_threshold
+            self.last_fire_day = -999
+            self.history_size = history_size
+            self._Y_buf = np.zeros(2 * history_size)
+            self._C_buf = np.zeros(2 * history_size)
+            self._len = 0
+            self._idx = 0
+        
+        def observe(self, Y, C):
+            """Record Y and C in the trend buffers (FluctuationController.observe)"""
+            i = self._idx
+            self._Y_buf[i] = Y
+            self._Y_buf[i + self.history_size] = Y
+            self._C_buf[i] = C
+            self._C_buf[i + self.history_size] = C
+            self._idx = (i + 1) % self.history_size
+            self._len = min(self._len + 1, self.history_size)
+        
+        def step(self, A, C, B, day):
+            """Compute fluctuation control output uF (FluctuationController.__call__)"""
+            if day - self.last_fire_day < self.cooldown_days or self._len < 3:
+                return 0.0
+            dY_dt, dC_dt, trap, g = fluctuation_kernel(
+                self._Y_buf, self._C_buf, self._idx + self.history_size, min(5, self._len),
+                A, C, B, self.A_threshold, self.stall_threshold
+            )
+            if not trap:
+                return 0.0
+            uF = min(self.max_uF, 0.5 * g * min(1.0, A / self.A_threshold) * max(0.0, 0.8 - B))
+            if uF > 0.02:
+                self.last_fire_day = day
+                return uF
+            return 0.0
+else:
+    FluctuationJit = None
 
 
 class AdaptiveFluctuationController(FluctuationController):
@@ -7,6 +7,36 @@ PID Controller Module
 import numpy as np
 from typing import Dict, Any, Optional
 from .state import State
+from ._compat import njit, native, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def pid_kernel(error, deltaY_min, kp, ki, kd, deadband, max_step, hysteresis, i, prev_e):
+    """
+    Stateless PID step for compiled kernels
+    
+    Returns:
+        Tuple (u, i, prev_e) of control output and updated integral/previous error
+    """
+    # Deadband widened by resolution limit (active is False inside the band)
+    band = max(deadband, deltaY_min)
+    active = abs(error) >= band
+    
+    # Update integral and derivative terms only when active, so the
+    # deadband leaves the controller state untouched
+    i += error * active
+    d = (error - prev_e) * active
+    prev_e = error * active + prev_e * (not active)
+    
+    # Compute PID output; hysteresis softens direction flips by 0.7
+    u = active * (kp*error + ki*i + kd*d) * (1 - 0.3*(abs(d) > hysteresis))
+    
+    # Limit step size (+ 0.0 turns the -0.0 produced inside the band into 0.0)
+    return max(-max_step, min(max_step, u)) + 0.0, i, prev_e
+
+
+# Prefer the ahead-of-time compiled kernel (no JIT warm-up) when it has been built
+_pid_kernel = native("pid_kernel", pid_kernel)
 
 
 class PID:
@@ -49,27 +79,11 @@ class PID:
         Returns:
             Control output
         """
-        # Deadband widened by resolution limit
-        band = max(self.deadband, deltaY_min)
-        if abs(error) < band: 
-            return 0.0
-            
-        # Update integral term
-        self.i += error
-        
-        # Calculate derivative term
-        d = error - self.prev_e
-        self.prev_e = error
-        
-        # Compute PID output
-        u = self.kp*error + self.ki*self.i + self.kd*d
-        
-        # Hysteresis: soften direction flips
-        if abs(d) > self.hysteresis: 
-            u *= 0.7
-            
-        # Limit step size
-        return max(-self.max_step, min(self.max_step, u))
+        u, self.i, self.prev_e = _pid_kernel(
+            float(error), float(deltaY_min), self.kp, self.ki, self.kd,
+            self.deadband, self.max_step, self.hysteresis, self.i, self.prev_e
+        )
+        return u
     
     def reset(self):
         """Reset PID controller state"""
@@ -81,7 +95,63 @@ class PID:
         self.kp = kp
         self.ki = ki
         self.kd = kd
+    
+    def to_jit(self) -> "PIDJit":
+        """
+        Copy gains and state into a PIDJit for use inside @njit code
+        
+        Returns:
+            PIDJit instance (requires numba)
+        """
+        if PIDJit is None:
+            raise ImportError("numba is required for PIDJit")
+        pid = PIDJit(self.kp, self.ki, self.kd, self.deadband, self.max_step, self.hysteresis)
+        pid.i = self.i
+        pid.prev_e = self.prev_e
+        return pid
 
 
 # Alias for backward compatibility
 PIDController = PID
+
+
+if NUMBA_AVAILABLE:
+    from numba import float64
+    from numba.experimental import jitclass
+
+    @jitclass([
+        ('kp', float64), ('ki', float64), ('kd', float64),
+        ('deadband', float64), ('max_step', float64), ('hysteresis', float64),
+        ('i', float64), ('prev_e', float64)
+    ])
+    class PIDJit:
+        """
+        nopython-mode PID with the same fields and semantics as PID
+        
+        Can be passed into and mutated inside @njit loops. jitclasses are compiled
+        per process (no on-disk cache), so the CLI keeps using the stateless pid_kernel.
+        """
+        
+        def __init__(self, kp, ki, kd, deadband, max_step, hysteresis):
+            self.kp = kp
+            self.ki = ki
+            self.kd = kd
+            self.deadband = deadband
+            self.max_step = max_step
+            self.hysteresis = hysteresis
+            self.i = 0.0
+            self.prev_e = 0.0
+        
+        def step(self, error, deltaY_min):
+            """Compute PID control output (PID.__call__)"""
+            u, self.i, self.prev_e = pid_kernel(error, deltaY_min, self.kp, self.ki, self.kd,
+                                                self.deadband, self.max_step, self.hysteresis,
+                                                self.i, self.prev_e)
+            return u
+        
+        def reset(self):
+            """Reset PID controller state"""
+            self.i = 0.0
+            self.prev_e = 0.0
+else:
+    PIDJit = None
@@ -4,14 +4,32 @@ System Dynamics Module
 # updates for N,A,C,B; noise; costs
 """
 
+import math
 import numpy as np
 from typing import Tuple, Dict, Any
 from .state import State
+from ._compat import njit, prange, vectorize, native, NUMBA_AVAILABLE
 
 
-def sigma(x): 
-    """Sigmoid activation function"""
-    return 1/(1+np.exp(-x))
+# Try to import scipy's expit (overflow-safe C sigmoid ufunc) for the non-numba fallback
+try:
+    from scipy.special import expit
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @vectorize(["float32(float32)", "float64(float64)"], cache=True)
+    def sigma(x):
+        """Sigmoid activation function (compiled ufunc: scalars and arrays)"""
+        return 1.0 / (1.0 + math.exp(-x))
+elif SCIPY_AVAILABLE:
+    sigma = expit
+else:
+    def sigma(x): 
+        """Sigmoid activation function"""
+        return 1/(1+np.exp(-x))
 
 
 def step(state: State, uA: float, uC: float, uF: float = 0.0, eps=0.0,
@@ -36,25 +54,205 @@ def step(state: State, uA: float, uC: float, uF: float = 0.0, eps=0.0,
     """
     β0, βN, βA, βC, βB = beta
     
-    # Calculate gradient strength from fluctuation control
-    G = gradient_strength(state) * uF
+    # Compiled scalar update (see step_scalar_kernel)
+    Y, N, A, C, B = _step_scalar_kernel(float(state.Y), float(state.N), float(state.A),
+                                        float(state.C), float(state.B),
+                                        float(uA), float(uC), float(uF), float(eps),
+                                        float(β0), float(βN), float(βA), float(βC), float(βB),
+                                        float(eta), float(rho), float(deltaC), float(kappa))
+    return State(Y=Y, N=N, A=A, C=C, B=B)
+
+
+@njit(cache=True)
+def gradient_strength_kernel(A, C, B, dY_dt, A_hi):
+    """Scalar form of gradient_strength() for compiled kernels"""
+    stall = A - A_hi
+    stall = stall if stall > 0.0 else 0.0
+    flat = 0.02 - abs(dY_dt)
+    flat = flat if flat > 0.0 else 0.0
+    weakC = 0.5 - (C if C > 0.0 else 0.0)
+    weakC = weakC if weakC > 0.0 else 0.0
+    guard = 0.8 - B
+    guard = guard if guard > 0.0 else 0.0
+    return 0.3 + stall * (1 + flat) * (1 + weakC) * guard
+
+
+@njit(cache=True)
+def step_scalar_kernel(Y, N, A, C, B, uA, uC, uF, eps, b0, bN, bA, bC, bB, eta, rho, deltaC, kappa):
+    """Scalar form of step() for compiled kernels; returns the new (Y, N, A, C, B) tuple"""
+    # Calculate gradient strength from fluctuation control (skipped on the
+    # common uF == 0 days, where the term is exactly zero)
+    G = gradient_strength_kernel(A, C, B, 0.0, 0.8) * uF if uF != 0.0 else 0.0
     
     # Update outcome using sigmoid model with engineered gradients
-    Y = sigma(β0 + βN*state.N + βA*state.A + βC*state.C - βB*state.B + G + eps)
+    Y_new = 1.0 / (1.0 + math.exp(-(b0 + bN*N + bA*A + bC*C - bB*B + G + eps)))
+    
+    # Update norm, attention (decay + control), constraint (control - decay)
+    # and burden (intervention costs, see cost())
+    return (Y_new,
+            (1 - eta)*N + eta*Y_new,
+            rho*A + uA,
+            C + uC - deltaC,
+            (1 - kappa)*B + kappa*(0.6*abs(uA) + 1.0*abs(uC) + 0.4*abs(uF)))
+
+
+@njit(cache=True)
+def step_kernel(s, uA, uC, uF, eps, b0, bN, bA, bC, bB, eta, rho, deltaC, kappa):
+    """Array form of step() for compiled kernels; returns a new (Y, N, A, C, B) array"""
+    out = np.empty(5)
+    out[0], out[1], out[2], out[3], out[4] = step_scalar_kernel(
+        s[0], s[1], s[2], s[3], s[4], uA, uC, uF, eps, b0, bN, bA, bC, bB, eta, rho, deltaC, kappa
+    )
+    return out
+
+
+# Prefer the ahead-of-time compiled kernels (no JIT warm-up) when they have been built
+_step_scalar_kernel = native("step_scalar_kernel", step_scalar_kernel)
+_step_kernel = native("step_kernel", step_kernel)
+
+
+def step_array(s: np.ndarray, uA: float, uC: float, uF: float = 0.0, eps=0.0,
+               beta=(-0.5, 3.0, 2.0, 2.0, 1.5),
+               eta=0.2, rho=0.9, deltaC=0.02, kappa=0.3) -> np.ndarray:
+    """
+    Execute one dynamics step on a packed state array
     
-    # Update norm based on observed outcomes
-    N = (1-eta)*state.N + eta*Y
+    Same model as step(), but the state is carried as a length-5 array
+    ordered (Y, N, A, C, B) so the loop avoids per-day State construction.
     
-    # Update attention with decay and control input
-    A = rho*state.A + uA
+    Args:
+        s: Current state array (see State.to_array)
+        uA, uC, uF, eps, beta, eta, rho, deltaC, kappa: As in step()
     
-    # Update constraint with control input and natural decay
-    C = state.C + uC - deltaC
+    Returns:
+        New state array
+    """
+    β0, βN, βA, βC, βB = beta
+    return _step_kernel(s, float(uA), float(uC), float(uF), float(eps),
+                        float(β0), float(βN), float(βA), float(βC), float(βB),
+                        float(eta), float(rho), float(deltaC), float(kappa))
+
+
+@njit(cache=True)
+def simulate_trajectory(Y0, N0, A0, C0, B0, uA, uC, uF, eps,
+                        b0, bN, bA, bC, bB, eta, rho, deltaC, kappa):
+    """
+    Open-loop trajectory for given per-day control and noise arrays in one compiled loop
     
-    # Update burden based on intervention costs
-    B = (1-kappa)*state.B + kappa*cost(uA, uC, uF)
+    Returns:
+        Tuple of (Y, N, A, C, B) arrays, one value per day (state after each step)
+    """
+    H = uA.shape[0]
+    Y_out = np.empty(H)
+    N_out = np.empty(H)
+    A_out = np.empty(H)
+    C_out = np.empty(H)
+    B_out = np.empty(H)
     
-    return State(Y=Y, N=N, A=A, C=C, B=B)
+    Y, N, A, C, B = Y0, N0, A0, C0, B0
+    for t in range(H):
+        Y, N, A, C, B = step_scalar_kernel(Y, N, A, C, B, uA[t], uC[t], uF[t], eps[t],
+                                           b0, bN, bA, bC, bB, eta, rho, deltaC, kappa)
+        Y_out[t] = Y
+        N_out[t] = N
+        A_out[t] = A
+        C_out[t] = C
+        B_out[t] = B
+    return Y_out, N_out, A_out, C_out, B_out
+
+
+_simulate_trajectory = native("simulate_trajectory", simulate_trajectory)
+
+
+def simulate_open_loop(state: State, uA, uC, uF=None, eps=None,
+                       beta=(-0.5, 3.0, 2.0, 2.0, 1.5),
+                       eta=0.2, rho=0.9, deltaC=0.02, kappa=0.3) -> Dict[str, np.ndarray]:
+    """
+    Simulate a trajectory under a fixed control schedule
+    
+    Args:
+        state: Initial system state
+        uA, uC: Attention/constraint control per day (length = horizon)
+        uF: Fluctuation control per day (defaults to zeros)
+        eps: Outcome noise per day (defaults to zeros)
+        beta, eta, rho, deltaC, kappa: As in step()
+    
+    Returns:
+        Dictionary of per-day state arrays {"Y", "N", "A", "C", "B"}
+    """
+    uA = np.asarray(uA, dtype=np.float64)
+    uC = np.asarray(uC, dtype=np.float64)
+    uF = np.zeros_like(uA) if uF is None else np.asarray(uF, dtype=np.float64)
+    eps = np.zeros_like(uA) if eps is None else np.asarray(eps, dtype=np.float64)
+    
+    out = _simulate_trajectory(float(state.Y), float(state.N), float(state.A), float(state.C), float(state.B),
+                               uA, uC, uF, eps, *map(float, beta),
+                               float(eta), float(rho), float(deltaC), float(kappa))
+    return dict(zip(("Y", "N", "A", "C", "B"), out))
+
+
+@njit(parallel=True, cache=True)
+def simulate_batch(Y0, N0, A0, C0, B0, uA, uC, uF, eps,
+                   b0, bN, bA, bC, bB, eta, rho, deltaC, kappa):
+    """
+    Independent open-loop replications in parallel (prange over the replication axis)
+    
+    Initial states are length-R arrays; controls and noise are (R, H) arrays.
+    
+    Returns:
+        Tuple of (Y, N, A, C, B) arrays of shape (R, H)
+    """
+    R, H = uA.shape
+    Y_out = np.empty((R, H))
+    N_out = np.empty((R, H))
+    A_out = np.empty((R, H))
+    C_out = np.empty((R, H))
+    B_out = np.empty((R, H))
+    
+    for r in prange(R):
+        Y, N, A, C, B = Y0[r], N0[r], A0[r], C0[r], B0[r]
+        for t in range(H):
+            Y, N, A, C, B = step_scalar_kernel(Y, N, A, C, B, uA[r, t], uC[r, t], uF[r, t], eps[r, t],
+                                               b0, bN, bA, bC, bB, eta, rho, deltaC, kappa)
+            Y_out[r, t] = Y
+            N_out[r, t] = N
+            A_out[r, t] = A
+            C_out[r, t] = C
+            B_out[r, t] = B
+    return Y_out, N_out, A_out, C_out, B_out
+
+
+def simulate_open_loop_batch(states: np.ndarray, uA, uC, uF=None, eps=None,
+                             beta=(-0.5, 3.0, 2.0, 2.0, 1.5),
+                             eta=0.2, rho=0.9, deltaC=0.02, kappa=0.3) -> Dict[str, np.ndarray]:
+    """
+    Simulate R independent trajectories (e.g. Monte-Carlo noise replications) in parallel
+    
+    Args:
+        states: Initial states, shape (R, 5) in (Y, N, A, C, B) order (see State.to_array)
+        uA, uC: Attention/constraint control, shape (R, H) (or (H,), shared by all replications)
+        uF: Fluctuation control, same shapes (defaults to zeros)
+        eps: Outcome noise, same shapes (defaults to zeros)
+        beta, eta, rho, deltaC, kappa: As in step()
+    
+    Returns:
+        Dictionary of state arrays {"Y", "N", "A", "C", "B"}, each of shape (R, H)
+    """
+    states = np.asarray(states, dtype=np.float64)
+    R = states.shape[0]
+    
+    def per_replication(u):
+        return np.ascontiguousarray(np.broadcast_to(np.asarray(u, dtype=np.float64), (R, np.shape(u)[-1])))
+    
+    uA = per_replication(uA)
+    uC = per_replication(uC)
+    uF = np.zeros_like(uA) if uF is None else per_replication(uF)
+    eps = np.zeros_like(uA) if eps is None else per_replication(eps)
+    
+    out = simulate_batch(*(np.ascontiguousarray(states[:, k]) for k in range(5)),
+                         uA, uC, uF, eps, *map(float, beta),
+                         float(eta), float(rho), float(deltaC), float(kappa))
+    return dict(zip(("Y", "N", "A", "C", "B"), out))
 
 
 def gradient_strength(state: State, dY_dt: float = 0.0, A_hi: float = 0.8) -> float:
@@ -69,17 +267,22 @@ def gradient_strength(state: State, dY_dt: float = 0.0, A_hi: float = 0.8) -> fl
     Returns:
         Gradient strength multiplier (0 to ~2)
     """
+    # Clamps are written as inline conditionals rather than max() calls
     # Higher when attention is high (energy available)
-    stall = max(0.0, state.A - A_hi) if state.A >= A_hi else 0.0
+    stall = state.A - A_hi
+    stall = stall if stall > 0.0 else 0.0
     
     # Higher when system is stalled (flat outcome trajectory)  
-    flat = max(0.0, 0.02 - abs(dY_dt))
+    flat = 0.02 - abs(dY_dt)
+    flat = flat if flat > 0.0 else 0.0
     
     # Higher when constraints are weak/decaying (need alternative pathways)
-    weakC = max(0.0, 0.5 - max(state.C, 0))  # Increased sensitivity
+    weakC = 0.5 - (state.C if state.C > 0.0 else 0.0)  # Increased sensitivity
+    weakC = weakC if weakC > 0.0 else 0.0
     
     # Lower when burden is high (avoid backlash)
-    guard = max(0.0, 0.8 - state.B)
+    guard = 0.8 - state.B
+    guard = guard if guard > 0.0 else 0.0
     
     # Base multiplier to ensure some effect
     base = 0.3
@@ -111,6 +314,17 @@ class SystemDynamics:
         """Initialize dynamics with configuration parameters"""
         self.config = config
         
+        # Unpack the parameters once; step() passes them positionally to the kernel
+        β0, βN, βA, βC, βB = config.get("beta", (-0.5, 3.0, 2.0, 2.0, 1.5))
+        self._params = tuple(float(v) for v in (
+            β0, βN, βA, βC, βB,
+            config.get("eta", 0.2), config.get("rho", 0.9),
+            config.get("deltaC", 0.02), config.get("kappa", 0.3),
+        ))
+        
     def step(self, state: State, uA: float, uC: float, eps: float = 0.0) -> State:
         """Execute one dynamics step using class configuration"""
-        return step(state, uA, uC, eps, **self.config)
+        Y, N, A, C, B = _step_scalar_kernel(float(state.Y), float(state.N), float(state.A),
+                                            float(state.C), float(state.B),
+                                            float(uA), float(uC), 0.0, float(eps), *self._params)
+        return State(Y=Y, N=N, A=A, C=C, B=B)
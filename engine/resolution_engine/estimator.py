@@ -4,11 +4,16 @@ Parameter Estimation Module
 # estimate NA_eff, λ_eff, k1 from logs
 """
 
-import numpy as np
+import math
 from typing import List, Dict, Any, Tuple
 from .state import State
 
 
+def _clamp(x: float, lo: float, hi: float) -> float:
+    """Scalar equivalent of np.clip"""
+    return lo if x < lo else (hi if x > hi else x)
+
+
 def estimate_na_eff(sensing_features: int, actuation_channels: int, feedback_latency_days: float) -> float:
     """
     Estimate effective numerical aperture
@@ -21,11 +26,11 @@ def estimate_na_eff(sensing_features: int, actuation_channels: int, feedback_lat
     Returns:
         Effective numerical aperture (0 to 1)
     """
-    # Simple monotone proxy in [0,1]
-    s = np.tanh(0.15*sensing_features)
-    a = np.tanh(0.25*actuation_channels)
+    # Simple monotone proxy in [0,1] (scalar math: no 0-d array round trips)
+    s = math.tanh(0.15*sensing_features)
+    a = math.tanh(0.25*actuation_channels)
     l = 1.0 / (1.0 + 0.1*feedback_latency_days)
-    return np.clip(0.5*(s+a)*l, 0, 1)
+    return _clamp(0.5*(s+a)*l, 0.0, 1.0)
 
 
 def estimate_lambda_eff(cadence_days: float, spatial_scale_km: float) -> float:
@@ -57,7 +62,7 @@ def estimate_k1(residual_std: float, ops_variance: float, habituation_rate: floa
     Returns:
         Process factor k1 (typically 0.2 to 2.0)
     """
-    return np.clip(0.3 + 0.7*np.tanh(residual_std + ops_variance + 2*habituation_rate), 0.2, 2.0)
+    return _clamp(0.3 + 0.7*math.tanh(residual_std + ops_variance + 2*habituation_rate), 0.2, 2.0)
 
 
 def min_resolvable_deltaY(na_eff: float, lam_eff: float, k1: float) -> float:
@@ -74,7 +79,7 @@ def min_resolvable_deltaY(na_eff: float, lam_eff: float, k1: float) -> float:
     """
     if na_eff <= 1e-6: 
         return 1.0
-    return np.clip(k1 * lam_eff / na_eff, 0.001, 1.0)
+    return _clamp(k1 * lam_eff / na_eff, 0.001, 1.0)
 
 
 class ParameterEstimator:
@@ -0,0 +1,170 @@
+"""
+Simulation Kernel Module
+
+# compiled whole-horizon loop: PID + bandit + fluctuation + dynamics
+"""
+
+import numpy as np
+from typing import Dict, Any
+from ._compat import njit
+from .state import State, StateBuffer
+from .dynamics import step_scalar_kernel
+from .controller_pid import PID, pid_kernel
+from .controller_bandit import ThompsonBandit
+from .controller_fluctuation import FluctuationController, fluctuation_kernel
+
+
+@njit(cache=True)
+def simulate_horizon(Y, N, A, C, B, horizon,
+                     kp, ki, kd, deadband, max_step, hysteresis, pid_i, pid_prev_e,
+                     max_uF, cooldown_days, A_threshold, stall_threshold, last_fire_day,
+                     arm_doses, alpha, beta, dYmin, target, reward_threshold, eps, rng,
+                     b0, bN, bA, bC, bB, eta, rho, deltaC, kappa):
+    """
+    Run the full control loop over the horizon in a single compiled pass
+
+    Bandit posteriors (alpha, beta) are updated in place, matching ThompsonBandit.update.
+
+    Returns:
+        Tuple of trajectory arrays (Y, N, A, C, B, error, uC, uA, uF, arm, reward, mode)
+        followed by the final controller state (pid_i, pid_prev_e, last_fire_day)
+    """
+    n_arms = arm_doses.shape[0]
+
+    Y_out = np.empty(horizon)
+    N_out = np.empty(horizon)
+    A_out = np.empty(horizon)
+    C_out = np.empty(horizon)
+    B_out = np.empty(horizon)
+    e_out = np.empty(horizon)
+    uC_out = np.empty(horizon)
+    uA_out = np.empty(horizon)
+    uF_out = np.empty(horizon)
+    arm_out = np.empty(horizon, dtype=np.int64)
+    reward_out = np.empty(horizon)
+    mode_out = np.empty(horizon, dtype=np.int8)  # 1 = fluctuation, 0 = precision
+    g1 = np.empty(n_arms)
+    g2 = np.empty(n_arms)
+
+    # Y/C history including the initial state (fluctuation trend window)
+    Y_hist = np.empty(horizon + 1)
+    C_hist = np.empty(horizon + 1)
+    Y_hist[0] = Y
+    C_hist[0] = C
+
+    for t in range(horizon):
+        e = target - Y
+        uC = 0.0
+        uF = 0.0
+
+        if abs(e) < dYmin:
+            # Fluctuation control (FluctuationController.__call__)
+            mode_out[t] = 1
+            n_hist = t + 1
+            if t - last_fire_day >= cooldown_days and n_hist >= 3:
+                dY_dt, dC_dt, trap, g = fluctuation_kernel(Y_hist, C_hist, n_hist, min(5, n_hist),
+                                                           A, C, B, A_threshold, stall_threshold)
+                if trap:
+                    headroom = min(1.0, A / A_threshold)
+                    burden_guard = max(0.0, 0.8 - B)
+                    u = min(max_uF, 0.5 * g * headroom * burden_guard)
+                    if u > 0.02:
+                        last_fire_day = t
+                        uF = u
+        else:
+            # Precision control (PID.__call__)
+            mode_out[t] = 0
+            uC, pid_i, pid_prev_e = pid_kernel(e, dYmin, kp, ki, kd, deadband, max_step,
+                                               hysteresis, pid_i, pid_prev_e)
+
+        # Thompson sampling arm selection (same draw order as ThompsonBandit.select:
+        # all alpha gammas, then all beta gammas)
+        for j in range(n_arms):
+            g1[j] = rng.standard_gamma(alpha[j])
+        for j in range(n_arms):
+            g2[j] = rng.standard_gamma(beta[j])
+        arm = 0
+        best = -1.0
+        for j in range(n_arms):
+            sample = g1[j] / (g1[j] + g2[j])
+            if sample > best:
+                best = sample
+                arm = j
+        uA = arm_doses[arm]
+
+        # System dynamics (dynamics.step)
+        Y, N, A, C, B = step_scalar_kernel(Y, N, A, C, B, uA, uC, uF, eps[t],
+                                           b0, bN, bA, bC, bB, eta, rho, deltaC, kappa)
+
+        # Bandit reward update
+        reward = 1.0 if Y > reward_threshold else 0.0
+        alpha[arm] += reward
+        beta[arm] += 1.0 - reward
+
+        Y_hist[t + 1] = Y
+        C_hist[t + 1] = C
+        Y_out[t] = Y
+        N_out[t] = N
+        A_out[t] = A
+        C_out[t] = C
+        B_out[t] = B
+        e_out[t] = e
+        uC_out[t] = uC
+        uA_out[t] = uA
+        uF_out[t] = uF
+        arm_out[t] = arm
+        reward_out[t] = reward
+
+    return (Y_out, N_out, A_out, C_out, B_out, e_out, uC_out, uA_out, uF_out,
+            arm_out, reward_out, mode_out, pid_i, pid_prev_e, last_fire_day)
+
+
+def simulate(state: State, horizon: int, pid: PID, bandit: ThompsonBandit,
+             fluctuation: FluctuationController, arm_doses: np.ndarray,
+             dYmin: float, target: float, reward_threshold: float, eps: np.ndarray,
+             beta=(-0.5, 3.0, 2.0, 2.0, 1.5), eta=0.2, rho=0.9, deltaC=0.02, kappa=0.3) -> Dict[str, Any]:
+    """
+    Simulate the whole horizon with the compiled kernel
+
+    Controller parameters and state are read from the controller objects and written
+    back afterwards, so they end in the same state as after the per-day Python loop.
+
+    Args:
+        state: Initial system state
+        horizon: Number of days to simulate
+        pid: PID controller
+        bandit: Thompson bandit (its generator drives arm selection)
+        fluctuation: Fluctuation controller
+        arm_doses: Attention dose per bandit arm
+        dYmin: Minimum resolvable change (constant over the run)
+        target: Target outcome Y
+        reward_threshold: Outcome threshold for bandit reward
+        eps: Pre-sampled outcome noise, one value per day
+        beta, eta, rho, deltaC, kappa: Dynamics parameters (defaults mirror dynamics.step)
+
+    Returns:
+        Dictionary of per-day trajectory arrays
+    """
+    out = simulate_horizon(
+        float(state.Y), float(state.N), float(state.A), float(state.C), float(state.B), int(horizon),
+        float(pid.kp), float(pid.ki), float(pid.kd), float(pid.deadband), float(pid.max_step),
+        float(pid.hysteresis), float(pid.i), float(pid.prev_e),
+        float(fluctuation.max_uF), int(fluctuation.cooldown_days), float(fluctuation.A_threshold),
+        float(fluctuation.stall_threshold), int(fluctuation.last_fire_day),
+        np.asarray(arm_doses, dtype=np.float64), bandit.a, bandit.b, float(dYmin), float(target),
+        float(reward_threshold), np.asarray(eps, dtype=np.float64), bandit.rng,
+        *map(float, beta), float(eta), float(rho), float(deltaC), float(kappa)
+    )
+
+    pid.i, pid.prev_e, fluctuation.last_fire_day = out[12], out[13], out[14]
+
+    keys = ("Y", "N", "A", "C", "B", "error", "uC", "uA", "uF", "arm", "reward", "mode")
+    trajectory = dict(zip(keys, out[:12]))
+
+    # Replay the trailing states into the fluctuation controller's trend buffers
+    states = StateBuffer.from_columns(trajectory)
+    replay = [state] + [states[t] for t in range(max(0, horizon - fluctuation.history_size), horizon)]
+    for s in replay[-fluctuation.history_size:]:
+        fluctuation.observe(s)
+
+    return trajectory
@@ -5,20 +5,82 @@ State Management Module
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Mapping
 import numpy as np
 
+STATE_FIELDS = ("Y", "N", "A", "C", "B")
+
 
 @dataclass
 class State:
     """
     Core system state representation
+    
+    Uses __slots__ (no per-instance __dict__) since a State is built every simulated day.
     """
+    __slots__ = ("Y", "N", "A", "C", "B")
+    
     Y: float   # outcome (0..1)
     N: float   # norm
     A: float   # attention
     C: float   # constraint
     B: float   # burden
+    
+    def to_array(self) -> np.ndarray:
+        """Pack the state into a length-5 array ordered (Y, N, A, C, B)"""
+        return np.array([self.Y, self.N, self.A, self.C, self.B], dtype=np.float64)
+    
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "State":
+        """Build a State from a length-5 array ordered (Y, N, A, C, B)"""
+        return cls(Y=float(arr[0]), N=float(arr[1]), A=float(arr[2]), C=float(arr[3]), B=float(arr[4]))
+
+
+@dataclass
+class StateBuffer:
+    """
+    State history stored column-wise (struct of arrays)
+    
+    One contiguous float64 array per state variable, so per-variable analysis
+    (mean/std/min/max) is a single vectorized reduction. Indexing a day returns
+    a State view for callers that want the scalar interface.
+    """
+    Y: np.ndarray
+    N: np.ndarray
+    A: np.ndarray
+    C: np.ndarray
+    B: np.ndarray
+    
+    @classmethod
+    def empty(cls, n: int) -> "StateBuffer":
+        """Allocate a buffer for n states"""
+        return cls(*(np.empty(n) for _ in STATE_FIELDS))
+    
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "StateBuffer":
+        """Build a buffer from a mapping with Y, N, A, C, B columns (e.g. a trajectory dict)"""
+        return cls(*(np.asarray(columns[k], dtype=np.float64) for k in STATE_FIELDS))
+    
+    @classmethod
+    def from_records(cls, records) -> "StateBuffer":
+        """Build a buffer from results["simulation_data"] records (each with a "state" dict)"""
+        n = len(records)
+        return cls(*(np.fromiter((day["state"][k] for day in records), dtype=np.float64, count=n)
+                     for k in STATE_FIELDS))
+    
+    def __len__(self) -> int:
+        return len(self.Y)
+    
+    def __getitem__(self, t: int) -> State:
+        return State(Y=float(self.Y[t]), N=float(self.N[t]), A=float(self.A[t]),
+                     C=float(self.C[t]), B=float(self.B[t]))
+    
+    def __setitem__(self, t: int, state: State):
+        self.Y[t], self.N[t], self.A[t], self.C[t], self.B[t] = state.Y, state.N, state.A, state.C, state.B
+    
+    def column(self, name: str) -> np.ndarray:
+        """Return the array for one state variable"""
+        return getattr(self, name)
 
 
 @dataclass  
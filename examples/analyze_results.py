@@ -6,12 +6,25 @@ Example script showing how to analyze simulation results from different output f
 """
 
 import json
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import argparse
 
+# Try to import orjson for faster result parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import pyarrow for multi-threaded CSV parsing
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 def load_results(file_path: str):
     """
@@ -26,11 +39,13 @@ def load_results(file_path: str):
     path = Path(file_path)
     
     if path.suffix.lower() == '.json':
+        if ORJSON_AVAILABLE:
+            return orjson.loads(path.read_bytes())
         with open(path, 'r') as f:
             return json.load(f)
     
     elif path.suffix.lower() == '.csv':
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, engine='pyarrow') if PYARROW_AVAILABLE else pd.read_csv(path)
         # Try to load metadata if available
         metadata_path = path.with_name(f"{path.stem}_metadata.json")
         metadata = {}
@@ -43,8 +58,26 @@ def load_results(file_path: str):
         raise ValueError(f"Unsupported file format: {path.suffix}")
 
 
-def analyze_json_results(results: dict):
-    """Analyze results from JSON format"""
+def _build_df(results: dict) -> pd.DataFrame:
+    """
+    Build the flat per-day DataFrame once for analysis and plotting
+    
+    JSON records are flattened so columns match the CSV layout (Y, N, ..., uC, uA, arm_name).
+    
+    Args:
+        results: Output of load_results
+        
+    Returns:
+        DataFrame with one row per simulated day
+    """
+    if 'csv_data' in results:
+        return results['csv_data']
+    df = pd.json_normalize(results['simulation_data'], sep='.')
+    return df.rename(columns=lambda col: col.split('.')[-1])
+
+
+def analyze_json_results(results: dict, df: pd.DataFrame = None):
+    """Analyze results from JSON format (df: prebuilt frame from _build_df, built here if omitted)"""
     print("=== CFAR Framework Simulation Analysis ===")
     print(f"Framework: {results['metadata']['framework']}")
     print(f"Timestamp: {results['metadata']['timestamp']}")
@@ -81,17 +114,18 @@ def analyze_json_results(results: dict):
         print(f"{arm}: {count} days ({percentage:.1f}%)")
     print()
     
-    # Convert to DataFrame for analysis
-    df = pd.DataFrame(results['simulation_data'])
+    if df is None:
+        df = _build_df(results)
     
     # State evolution analysis
     print("=== State Variable Analysis ===")
     state_cols = ['Y', 'N', 'A', 'C', 'B']
     for col in state_cols:
-        values = [day['state'][col] for day in results['simulation_data']]
-        print(f"{col}: mean={pd.Series(values).mean():.3f}, "
-              f"std={pd.Series(values).std():.3f}, "
-              f"min={min(values):.3f}, max={max(values):.3f}")
+        # Reduce the flat column's float64 buffer directly in NumPy
+        values = df[col].to_numpy(dtype=np.float64)
+        print(f"{col}: mean={values.mean():.3f}, "
+              f"std={values.std(ddof=1):.3f}, "
+              f"min={values.min():.3f}, max={values.max():.3f}")
     
     return df
 
@@ -127,14 +161,24 @@ def analyze_csv_results(data: dict):
     return df
 
 
-def create_plots(df, output_dir="plots"):
+def create_plots(df, output_dir="plots", dpi=150):
     """
     Create visualization plots from simulation data
     
+    All panels are laid out on a single GridSpec figure and rendered with one
+    savefig call (manual spacing, no tight_layout pass).
+    
     Args:
         df: DataFrame with simulation data
         output_dir: Directory to save plots
+        dpi: Resolution of the saved figure
     """
+    # Plotting libraries are imported here so analysis without --plots starts fast
+    import matplotlib
+    matplotlib.use('Agg')  # file output only; no interactive backend needed
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
@@ -142,150 +186,135 @@ def create_plots(df, output_dir="plots"):
     plt.style.use('seaborn-v0_8')
     sns.set_palette("husl")
     
-    # 1. State Evolution Over Time
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-    fig.suptitle('CFAR Framework: State Evolution Over Time', fontsize=16)
+    state_vars = [var for var in ['Y', 'N', 'A', 'C', 'B'] if var in df.columns]
+    state_titles = {'Y': 'Y (Outcome)', 'N': 'N (Norm)', 'A': 'A (Attention)',
+                    'C': 'C (Constraint)', 'B': 'B (Burden)'}
+    state_colors = {'Y': 'blue', 'N': 'green', 'A': 'orange', 'C': 'red', 'B': 'purple'}
     
-    state_vars = ['Y', 'N', 'A', 'C', 'B']
-    colors = ['blue', 'green', 'orange', 'red', 'purple']
+    has_controls = 'uC' in df.columns and 'uA' in df.columns
+    has_fluctuation = has_controls and 'uF' in df.columns
+    params = [p for p in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min'] if p in df.columns]
+    param_names = {'NA_eff': 'Numerical Aperture', 'lambda_eff': 'Wavelength',
+                   'k1': 'Process Factor', 'delta_Y_min': 'Min Resolvable Change'}
+    has_arms = 'arm_name' in df.columns
+    has_modes = 'control_mode' in df.columns
     
-    for i, (var, color) in enumerate(zip(state_vars, colors)):
-        row = i // 3
-        col = i % 3
-        
-        if var in df.columns:
-            axes[row, col].plot(df['day'], df[var], color=color, linewidth=2)
-            axes[row, col].set_title(f'{var} (Outcome)' if var == 'Y' else 
-                                   f'{var} ({"Norm" if var == "N" else "Attention" if var == "A" else "Constraint" if var == "C" else "Burden"})')
-            axes[row, col].set_xlabel('Day')
-            axes[row, col].set_ylabel(var)
-            axes[row, col].grid(True, alpha=0.3)
-    
-    # Remove empty subplot
-    if len(state_vars) < 6:
-        fig.delaxes(axes[1, 2])
-    
-    plt.tight_layout()
-    plt.savefig(output_path / 'state_evolution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    # Row plan on a 12-column grid: state panels take 4 columns (3 per row),
+    # resolution parameters 3 columns (4 per row), time series the full width.
+    # The arm usage bar fills the free slot after the state panels.
+    state_rows = -(-(len(state_vars) + has_arms) // 3)
+    control_rows = (3 if has_fluctuation else 2) if has_controls else 0
+    param_rows = 1 if 'delta_Y_min' in df.columns and params else 0
+    n_rows = state_rows + control_rows + param_rows + has_modes
+    if n_rows == 0:
+        print("No plottable columns found")
+        return
     
-    # 2. Control Actions (Enhanced with fluctuation control)
-    if 'uC' in df.columns and 'uA' in df.columns:
-        has_fluctuation = 'uF' in df.columns
-        n_plots = 3 if has_fluctuation else 2
-        
-        fig, axes = plt.subplots(n_plots, 1, figsize=(12, 10 if has_fluctuation else 8))
-        fig.suptitle('CFAR Framework: Control Actions', fontsize=16)
-        
-        if n_plots == 2:
-            axes = [axes[0], axes[1]]
-        
-        # PID Control
-        axes[0].plot(df['day'], df['uC'], color='red', linewidth=2, label='Structural Control (uC)')
-        axes[0].set_title('PID Controller Output (Precision Mode)')
-        axes[0].set_ylabel('Control Signal')
-        axes[0].grid(True, alpha=0.3)
-        axes[0].legend()
-        
-        # Bandit Control  
-        axes[1].plot(df['day'], df['uA'], color='blue', linewidth=2, label='Attention Control (uA)')
-        axes[1].set_title('Bandit Controller Output (Fast Interventions)')
-        axes[1].set_ylabel('Control Signal')
-        axes[1].grid(True, alpha=0.3)
-        axes[1].legend()
-        
-        # Fluctuation Control (if available)
-        if has_fluctuation:
-            axes[2].plot(df['day'], df['uF'], color='purple', linewidth=2, label='Fluctuation Control (uF)')
-            # Highlight pulses
-            pulse_days = df[df['uF'] > 0.01]['day']
-            pulse_values = df[df['uF'] > 0.01]['uF']
-            axes[2].scatter(pulse_days, pulse_values, color='orange', s=50, zorder=5, label='Fluctuation Pulses')
-            
-            axes[2].set_title('Fluctuation Controller Output (Gradient Engineering)')
-            axes[2].set_xlabel('Day')
-            axes[2].set_ylabel('Control Signal')
-            axes[2].grid(True, alpha=0.3)
-            axes[2].legend()
-        else:
-            axes[1].set_xlabel('Day')
-        
-        plt.tight_layout()
-        plt.savefig(output_path / 'control_actions.png', dpi=300, bbox_inches='tight')
-        plt.close()
+    # Mark fluctuation pulses
+    pulses = df[df['uF'] > 0.01] if 'uF' in df.columns else None
     
-    # 3. Resolution Parameters
-    if 'delta_Y_min' in df.columns:
-        fig, axes = plt.subplots(2, 2, figsize=(12, 8))
-        fig.suptitle('CFAR Framework: Resolution Parameters', fontsize=16)
-        
-        params = ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']
-        param_names = ['Numerical Aperture', 'Wavelength', 'Process Factor', 'Min Resolvable Change']
-        
-        for i, (param, name) in enumerate(zip(params, param_names)):
-            row = i // 2
-            col = i % 2
-            
-            if param in df.columns:
-                axes[row, col].plot(df['day'], df[param], linewidth=2)
-                axes[row, col].set_title(name)
-                axes[row, col].set_xlabel('Day')
-                axes[row, col].set_ylabel(param)
-                axes[row, col].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(output_path / 'resolution_parameters.png', dpi=300, bbox_inches='tight')
-        plt.close()
+    height = 3.5 * n_rows
+    fig = plt.figure(figsize=(15, height))
+    gs = fig.add_gridspec(n_rows, 12)
+    fig.suptitle('CFAR Framework: Simulation Analysis', fontsize=16, y=1 - 0.3 / height)
+    row = 0
+    
+    # 1. State Evolution Over Time
+    for i, var in enumerate(state_vars):
+        ax = fig.add_subplot(gs[row + i // 3, 4 * (i % 3):4 * (i % 3) + 4])
+        ax.plot(df['day'], df[var], color=state_colors[var], linewidth=2)
+        ax.set_title(state_titles[var])
+        ax.set_xlabel('Day')
+        ax.set_ylabel(var)
+        ax.grid(True, alpha=0.3)
     
     # 4. Arm Selection (if available)
-    if 'arm_name' in df.columns:
+    if has_arms:
+        i = len(state_vars)
+        ax = fig.add_subplot(gs[row + i // 3, 4 * (i % 3):4 * (i % 3) + 4])
         arm_counts = df['arm_name'].value_counts()
-        
-        plt.figure(figsize=(10, 6))
-        bars = plt.bar(arm_counts.index, arm_counts.values)
-        plt.title('CFAR Framework: Intervention Arm Usage')
-        plt.xlabel('Intervention Type')
-        plt.ylabel('Days Used')
-        plt.xticks(rotation=45)
+        bars = ax.bar(arm_counts.index, arm_counts.values)
+        ax.set_title('Intervention Arm Usage')
+        ax.set_xlabel('Intervention Type')
+        ax.set_ylabel('Days Used')
+        ax.tick_params(axis='x', rotation=45)
         
         # Add percentage labels on bars
         total_days = len(df)
         for bar, count in zip(bars, arm_counts.values):
             percentage = (count / total_days) * 100
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
                     f'{percentage:.1f}%', ha='center', va='bottom')
+    row += state_rows
+    
+    # 2. Control Actions (Enhanced with fluctuation control)
+    if has_controls:
+        # PID Control
+        ax = fig.add_subplot(gs[row, :])
+        ax.plot(df['day'], df['uC'], color='red', linewidth=2, label='Structural Control (uC)')
+        ax.set_title('PID Controller Output (Precision Mode)')
+        ax.set_ylabel('Control Signal')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+        
+        # Bandit Control  
+        ax = fig.add_subplot(gs[row + 1, :])
+        ax.plot(df['day'], df['uA'], color='blue', linewidth=2, label='Attention Control (uA)')
+        ax.set_title('Bandit Controller Output (Fast Interventions)')
+        ax.set_ylabel('Control Signal')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
         
-        plt.tight_layout()
-        plt.savefig(output_path / 'arm_usage.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        # Fluctuation Control (if available)
+        if has_fluctuation:
+            ax = fig.add_subplot(gs[row + 2, :])
+            ax.plot(df['day'], df['uF'], color='purple', linewidth=2, label='Fluctuation Control (uF)')
+            # Highlight pulses
+            ax.scatter(pulses['day'], pulses['uF'], color='orange', s=50, zorder=5, label='Fluctuation Pulses')
+            ax.set_title('Fluctuation Controller Output (Gradient Engineering)')
+            ax.set_ylabel('Control Signal')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+        ax.set_xlabel('Day')
+        row += control_rows
+    
+    # 3. Resolution Parameters
+    if param_rows:
+        for i, param in enumerate(params):
+            ax = fig.add_subplot(gs[row, 3 * i:3 * i + 3])
+            ax.plot(df['day'], df[param], linewidth=2)
+            ax.set_title(param_names[param])
+            ax.set_xlabel('Day')
+            ax.set_ylabel(param)
+            ax.grid(True, alpha=0.3)
+        row += param_rows
     
     # 5. Control Mode Timeline (New with fluctuation control)
-    if 'control_mode' in df.columns:
-        plt.figure(figsize=(12, 4))
+    if has_modes:
+        ax = fig.add_subplot(gs[row, :])
         
         # Create timeline showing precision vs fluctuation modes
         precision_mask = df['control_mode'] == 'precision'
         fluctuation_mask = df['control_mode'] == 'fluctuation'
         
-        plt.fill_between(df['day'], 0, 1, where=precision_mask, color='blue', alpha=0.7, label='Precision Mode [P]')
-        plt.fill_between(df['day'], 0, 1, where=fluctuation_mask, color='purple', alpha=0.7, label='Fluctuation Mode [F]')
+        ax.fill_between(df['day'], 0, 1, where=precision_mask, color='blue', alpha=0.7, label='Precision Mode [P]')
+        ax.fill_between(df['day'], 0, 1, where=fluctuation_mask, color='purple', alpha=0.7, label='Fluctuation Mode [F]')
         
-        # Mark fluctuation pulses
-        if 'uF' in df.columns:
-            pulse_days = df[df['uF'] > 0.01]['day']
-            for day in pulse_days:
-                plt.axvline(x=day, color='orange', linestyle='--', alpha=0.8)
+        # Mark fluctuation pulses (one collection instead of a line per pulse)
+        if pulses is not None and len(pulses):
+            ax.vlines(pulses['day'], 0, 1, color='orange', linestyle='--', alpha=0.8)
         
-        plt.title('CFAR Framework: Control Mode Timeline')
-        plt.xlabel('Day')
-        plt.ylabel('Control Mode')
-        plt.yticks([0, 1], ['', ''])
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(output_path / 'control_timeline.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_title('Control Mode Timeline')
+        ax.set_xlabel('Day')
+        ax.set_ylabel('Control Mode')
+        ax.set_yticks([0, 1], ['', ''])
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    fig.subplots_adjust(left=0.06, right=0.98, bottom=0.04, top=1 - 1.1 / height,
+                        hspace=0.6, wspace=1.2)
+    fig.savefig(output_path / 'cfar_analysis.png', dpi=dpi)
+    plt.close(fig)
     
     print(f"Plots saved to: {output_path.absolute()}")
 
@@ -295,22 +324,24 @@ def main():
     parser.add_argument("results_file", help="Path to results file (JSON or CSV)")
     parser.add_argument("--plots", action="store_true", help="Generate visualization plots")
     parser.add_argument("--plot-dir", default="plots", help="Directory for plots (default: plots)")
+    parser.add_argument("--dpi", type=int, default=150, help="Resolution of saved plots (default: 150)")
     
     args = parser.parse_args()
     
     # Load and analyze results
     results = load_results(args.results_file)
+    df = _build_df(results)  # built once, shared by the analysis and the plots
     
-    if isinstance(results, dict) and 'csv_data' in results:
+    if 'csv_data' in results:
         # CSV format
-        df = analyze_csv_results(results)
+        analyze_csv_results(results)
     else:
         # JSON format
-        df = analyze_json_results(results)
+        analyze_json_results(results, df)
     
     # Generate plots if requested
     if args.plots:
-        create_plots(df, args.plot_dir)
+        create_plots(df, args.plot_dir, args.dpi)
 
 
 if __name__ == "__main__":
@@ -5,16 +5,41 @@ CFAR Framework Report Generator
 Generate comprehensive PDF and HTML reports with interpretive analysis
 """
 
+import csv
 import json
-import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import seaborn as sns
 from pathlib import Path
 import argparse
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Any, List
 import numpy as np
 
+# Try to import orjson for faster JSON parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import pyarrow for Parquet and fast CSV data export
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import numba for the compiled phase classifier
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Try to import reportlab for PDF generation
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -33,6 +58,99 @@ plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
 
+PHASE_NAMES = ['building', 'approaching', 'achieved', 'near_target']
+PHASE_DESCRIPTIONS = {
+    'building': 'Building toward target performance',
+    'approaching': 'Approaching target range',
+    'achieved': 'Target performance achieved',
+    'near_target': 'Near target but not fully achieved'
+}
+
+# Static <style> block of the HTML report, built once at import
+REPORT_STYLE = """<style>
+    body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+    .header { background: #f4f4f4; padding: 20px; border-radius: 5px; }
+    .section { margin: 30px 0; }
+    .metric { background: #e9f5ff; padding: 15px; margin: 10px 0; border-radius: 5px; }
+    .insight { background: #f0f8e9; padding: 15px; margin: 10px 0; border-radius: 5px; }
+    .recommendation { background: #fff3cd; padding: 15px; margin: 10px 0; border-radius: 5px; }
+    .plot { text-align: center; margin: 20px 0; }
+    table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background-color: #f2f2f2; }
+    .grade { font-size: 2em; font-weight: bold; color: #2e7d32; }
+</style>"""
+
+
+def _phase_runs_numpy(Y: np.ndarray, target: float):
+    """
+    Split Y into runs of constant performance phase
+    
+    Args:
+        Y: Outcome series (float64)
+        target: Target outcome
+        
+    Returns:
+        (starts, labels): start day and PHASE_NAMES index of each run
+    """
+    labels = np.where(Y < target * 0.8, 0,
+                      np.where(Y < target * 0.95, 1,
+                               np.where(Y >= target, 2, 3)))
+    starts = np.flatnonzero(np.diff(labels, prepend=-1))
+    return starts, labels[starts]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _phase_runs(Y, target):
+        """Compiled single-pass form of _phase_runs_numpy (same labels and return values)"""
+        n = Y.shape[0]
+        starts = np.empty(n, dtype=np.int64)
+        labels = np.empty(n, dtype=np.int64)
+        n_runs = 0
+        current = -1
+        for i in range(n):
+            y = Y[i]
+            if y < target * 0.8:
+                label = 0
+            elif y < target * 0.95:
+                label = 1
+            elif y >= target:
+                label = 2
+            else:
+                label = 3
+            if label != current:
+                starts[n_runs] = i
+                labels[n_runs] = label
+                n_runs += 1
+                current = label
+        return starts[:n_runs], labels[:n_runs]
+else:
+    _phase_runs = _phase_runs_numpy
+
+
+def _plot_lines(ax, x: np.ndarray, series: List[np.ndarray], colors: List[str], labels: List[str],
+                linewidth: float = 2):
+    """
+    Draw several series sharing the same x values as a single LineCollection
+    
+    Args:
+        ax: Target axes
+        x: Shared x values
+        series: One y array per line
+        colors: Line colour per series
+        labels: Legend label per series
+        linewidth: Line width
+    """
+    segments = [np.column_stack([x, y]) for y in series]
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidth))
+    ax.autoscale_view()
+    
+    # Empty proxy lines keep one legend entry per series
+    for color, label in zip(colors, labels):
+        ax.plot([], [], color=color, linewidth=linewidth, label=label)
+
+
 class CFARReportGenerator:
     """Generate comprehensive reports for CFAR Framework simulation results"""
     
@@ -40,38 +158,87 @@ class CFARReportGenerator:
         """Initialize with simulation results"""
         self.results_file = Path(results_file)
         
-        with open(self.results_file, 'r') as f:
-            self.results = json.load(f)
+        if ORJSON_AVAILABLE:
+            self.results = orjson.loads(self.results_file.read_bytes())
+        else:
+            with open(self.results_file, 'r') as f:
+                self.results = json.load(f)
         
-        self.df = pd.DataFrame(self.results['simulation_data'])
+        self.records = self.results['simulation_data']  # per-day dicts, shared by every analysis pass
         self.metadata = self.results['metadata']
         self.summary = self.results['summary']
+        self._arrays = self._build_soa()
+        
+        # Fluctuation pulse days, shared by the strategy analysis and the plots
+        self._pulse_mask = self._arrays['control']['uF'] > 0.01
+        self._pulse_days = np.flatnonzero(self._pulse_mask)
         
         # Create output directory
         self.output_dir = Path(f"reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         self.output_dir.mkdir(exist_ok=True)
         
-        # Generate interpretive analysis
+        # Generate interpretive analysis once; every exporter and main() read this copy
         self.analysis = self.generate_interpretive_analysis()
+        
+        # Plots are rendered lazily, only for the HTML report: (dpi, plot files) of the last render
+        self._plots = None
+    
+    @cached_property
+    def _Y_max(self) -> float:
+        """Peak outcome Y over the run"""
+        return float(self._arrays['state']['Y'].max())
+    
+    @cached_property
+    def _Y_min(self) -> float:
+        """Lowest outcome Y over the run"""
+        return float(self._arrays['state']['Y'].min())
+    
+    @cached_property
+    def _A_max(self) -> float:
+        """Peak attention A over the run"""
+        return float(self._arrays['state']['A'].max())
+    
+    def _build_soa(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Extract every numeric series from the records once, as float64 arrays
+        
+        Returns:
+            {'day': day indices, 'state': {Y, N, A, C, B},
+             'control': {uC, uA, uF, control_mode, arm_name},
+             'parameters': {NA_eff, lambda_eff, k1, delta_Y_min}}
+            (day is int64, control_mode/arm_name are string arrays, the rest are float64)
+        """
+        rec = self.records
+        fields = {
+            'state': ['Y', 'N', 'A', 'C', 'B'],
+            'control': ['uC', 'uA', 'uF'],
+            'parameters': ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min'],
+        }
+        arrays = {
+            group: {var: np.fromiter((r[group][var] for r in rec), dtype=np.float64, count=len(rec))
+                    for var in names}
+            for group, names in fields.items()
+        }
+        arrays['control']['control_mode'] = np.fromiter(
+            (r['control']['control_mode'] for r in rec), dtype='U12', count=len(rec))
+        arrays['day'] = np.fromiter((r['day'] for r in rec), dtype=np.int64, count=len(rec))
+        
+        # Arm names are user-configured (no fixed width), so fill an object array by index
+        arm_name = np.empty(len(rec), dtype=object)
+        for i, r in enumerate(rec):
+            arm_name[i] = r['control']['arm_name']
+        arrays['control']['arm_name'] = arm_name
+        return arrays
     
     def generate_interpretive_analysis(self) -> Dict[str, Any]:
         """Generate interpretive analysis of the simulation results"""
         
-        # Extract time series data
-        state_data = {}
-        control_data = {}
-        param_data = {}
-        
-        for var in ['Y', 'N', 'A', 'C', 'B']:
-            state_data[var] = [day['state'][var] for day in self.df.to_dict('records')]
-        
-        for var in ['uC', 'uA', 'uF']:
-            control_data[var] = [day['control'][var] for day in self.df.to_dict('records')]
-        
-        for var in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']:
-            param_data[var] = [day['parameters'][var] for day in self.df.to_dict('records')]
+        # Time series data (column arrays built once in _build_soa)
+        state_data = self._arrays['state']
+        control_data = self._arrays['control']
+        param_data = self._arrays['parameters']
         
-        days = list(range(len(state_data['Y'])))
+        days = list(range(len(self.records)))
         
         # Performance analysis
         performance = self.analyze_performance(state_data, days)
@@ -103,16 +270,13 @@ class CFARReportGenerator:
         target = self.metadata['target_Y']
         
         # Performance metrics
-        final_Y = Y_values[-1]
-        max_Y = max(Y_values)
-        min_Y = min(Y_values)
+        final_Y = float(Y_values[-1])
+        max_Y = self._Y_max
+        min_Y = self._Y_min
         
-        # Time to target
-        time_to_target = None
-        for i, y in enumerate(Y_values):
-            if y >= target:
-                time_to_target = i
-                break
+        # Time to target (first day at or above target)
+        reached = Y_values >= target
+        time_to_target = int(reached.argmax()) if reached.any() else None
         
         # Stability analysis
         if len(Y_values) > 20:
@@ -144,15 +308,16 @@ class CFARReportGenerator:
         uF_values = control_data['uF']
         
         # Control mode analysis
-        control_modes = [day['control']['control_mode'] for day in self.df.to_dict('records')]
-        precision_days = sum(1 for mode in control_modes if mode == 'precision')
-        fluctuation_days = len(control_modes) - precision_days
+        control_modes = control_data['control_mode']
+        precision_days = int(np.count_nonzero(control_modes == 'precision'))
+        fluctuation_days = control_modes.size - precision_days
         
-        # Fluctuation pulse analysis
-        fluctuation_pulses = [(i, uF) for i, uF in enumerate(uF_values) if uF > 0.01]
+        # Fluctuation pulse analysis (pulse day indices)
+        fluctuation_pulses = self._pulse_days
         
-        # Control effort analysis
-        total_control_effort = sum(abs(uC) + abs(uA) + abs(uF) for uC, uA, uF in zip(uC_values, uA_values, uF_values))
+        # Control effort analysis (one reduction over the stacked |u| signals)
+        effort = np.abs(np.stack([uC_values, uA_values, uF_values]))
+        total_control_effort = float(effort.sum())
         
         # Strategy effectiveness
         strategy_effectiveness = self.evaluate_strategy_effectiveness(control_data, fluctuation_pulses)
@@ -176,8 +341,8 @@ class CFARReportGenerator:
         constraint_trend = 'declining' if C_values[-1] < C_values[0] else 'stable' if abs(C_values[-1] - C_values[0]) < 0.1 else 'increasing'
         
         # Attention dynamics
-        A_values = state_data['A']
-        attention_saturation = max(A_values) > 0.9
+        max_attention = self._A_max
+        attention_saturation = max_attention > 0.9
         
         # Resolution parameter analysis
         delta_Y_min_values = param_data['delta_Y_min']
@@ -190,7 +355,7 @@ class CFARReportGenerator:
         return {
             'constraint_trend': constraint_trend,
             'attention_saturation': attention_saturation,
-            'max_attention': max(A_values),
+            'max_attention': max_attention,
             'average_resolution': avg_resolution,
             'resolution_trend': resolution_trend,
             'system_phases': system_phases,
@@ -261,46 +426,26 @@ class CFARReportGenerator:
         
         return recommendations
     
-    def identify_performance_phases(self, Y_values: List[float], target: float) -> List[Dict]:
+    def identify_performance_phases(self, Y_values: np.ndarray, target: float) -> List[Dict]:
         """Identify distinct performance phases in the simulation"""
         
-        phases = []
-        current_phase = None
-        phase_start = 0
-        
-        for i, y in enumerate(Y_values):
-            # Determine current state
-            if y < target * 0.8:
-                state = 'building'
-            elif y < target * 0.95:
-                state = 'approaching'
-            elif y >= target:
-                state = 'achieved'
-            else:
-                state = 'near_target'
-            
-            # Check for phase change
-            if current_phase != state:
-                if current_phase is not None:
-                    phases.append({
-                        'phase': current_phase,
-                        'start_day': phase_start,
-                        'end_day': i - 1,
-                        'duration': i - phase_start
-                    })
-                current_phase = state
-                phase_start = i
-        
-        # Add final phase
-        if current_phase is not None:
-            phases.append({
-                'phase': current_phase,
-                'start_day': phase_start,
-                'end_day': len(Y_values) - 1,
-                'duration': len(Y_values) - phase_start
-            })
-        
-        return phases
+        Y_values = np.asarray(Y_values, dtype=np.float64)
+        if Y_values.size == 0:
+            return []
+        
+        # Run-length encode the per-day phase labels (compiled when numba is available)
+        starts, labels = _phase_runs(Y_values, float(target))
+        bounds = starts.tolist() + [Y_values.size]
+        
+        return [
+            {
+                'phase': PHASE_NAMES[label],
+                'start_day': start,
+                'end_day': end - 1,
+                'duration': end - start
+            }
+            for label, start, end in zip(labels.tolist(), bounds[:-1], bounds[1:])
+        ]
     
     def calculate_performance_grade(self, final_Y: float, target: float, time_to_target: int) -> str:
         """Calculate an overall performance grade"""
@@ -332,7 +477,7 @@ class CFARReportGenerator:
         else:
             return 'F'
     
-    def evaluate_strategy_effectiveness(self, control_data: Dict, fluctuation_pulses: List) -> str:
+    def evaluate_strategy_effectiveness(self, control_data: Dict, fluctuation_pulses: np.ndarray) -> str:
         """Evaluate the effectiveness of the control strategy"""
         
         # Simple heuristic based on control patterns
@@ -348,11 +493,11 @@ class CFARReportGenerator:
         else:
             return 'minimal'
     
-    def identify_control_patterns(self, control_modes: List[str], fluctuation_pulses: List) -> str:
+    def identify_control_patterns(self, control_modes: np.ndarray, fluctuation_pulses: np.ndarray) -> str:
         """Identify the dominant control pattern"""
         
-        precision_count = sum(1 for mode in control_modes if mode == 'precision')
-        fluctuation_count = len(control_modes) - precision_count
+        precision_count = int(np.count_nonzero(control_modes == 'precision'))
+        fluctuation_count = control_modes.size - precision_count
         
         if fluctuation_count > precision_count * 3:
             return 'fluctuation_dominant'
@@ -371,14 +516,12 @@ class CFARReportGenerator:
         if Y_values[10] > Y_values[0] * 1.2:  # 20% improvement in first 10 days
             phases.append('rapid_initial_growth')
         
-        # Check for plateau
-        if len(Y_values) > 30:
-            mid_section = Y_values[20:40]
-            if max(mid_section) - min(mid_section) < 0.05:  # Low variance in middle section
-                phases.append('plateau')
+        # Check for plateau (low spread in the middle section)
+        if Y_values.size > 30 and np.ptp(Y_values[20:40]) < 0.05:
+            phases.append('plateau')
         
         # Check for decline
-        if Y_values[-1] < max(Y_values) * 0.9:
+        if Y_values[-1] < self._Y_max * 0.9:
             phases.append('performance_decline')
         
         return phases if phases else ['steady_state']
@@ -386,13 +529,10 @@ class CFARReportGenerator:
     def identify_dominant_dynamics(self, state_data: Dict) -> str:
         """Identify the dominant system dynamics"""
         
-        # Analyze which state variable shows most change
-        changes = {}
-        for var in ['Y', 'N', 'A', 'C', 'B']:
-            values = state_data[var]
-            changes[var] = max(values) - min(values)
-        
-        dominant_var = max(changes, key=changes.get)
+        # Analyze which state variable shows most change (peak-to-peak of each row)
+        state_vars = ('Y', 'N', 'A', 'C', 'B')
+        ranges = np.ptp(np.stack([state_data[var] for var in state_vars]), axis=1)
+        dominant_var = state_vars[int(ranges.argmax())]
         
         dynamics_map = {
             'Y': 'outcome_driven',
@@ -404,19 +544,36 @@ class CFARReportGenerator:
         
         return dynamics_map.get(dominant_var, 'balanced')
     
-    def generate_plots(self) -> Dict[str, str]:
-        """Generate all plots and return file paths"""
+    def generate_plots(self, dpi: int = 150) -> Dict[str, str]:
+        """
+        Generate all plots and return file paths
+        
+        Rendering is the slowest export step, so the files are written once per
+        dpi and reused by later calls at that dpi. Only the HTML report needs them.
+        
+        Args:
+            dpi: Resolution of the saved figures (150 for drafts, 300 for final output)
+        
+        Returns:
+            Mapping of plot name to file path
+        """
+        
+        if self._plots is not None and self._plots[0] == dpi:
+            return self._plots[1]
         
         plot_files = {}
         
-        # 1. Performance overview
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        # 1. Performance overview (constrained layout: geometry is solved once, no tight bbox pass)
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12), constrained_layout=True)
+        
+        state = self._arrays['state']
+        control = self._arrays['control']
+        days = np.arange(len(self.records))
         
         # State evolution
-        days = list(range(len(self.df)))
-        for var, color in zip(['Y', 'N', 'A', 'C', 'B'], ['blue', 'green', 'orange', 'red', 'purple']):
-            values = [day['state'][var] for day in self.df.to_dict('records')]
-            ax1.plot(days, values, label=var, color=color, linewidth=2)
+        state_vars = ['Y', 'N', 'A', 'C', 'B']
+        _plot_lines(ax1, days, [state[var] for var in state_vars],
+                    ['blue', 'green', 'orange', 'red', 'purple'], state_vars)
         ax1.axhline(y=self.metadata['target_Y'], color='black', linestyle='--', alpha=0.7, label='Target')
         ax1.set_title('State Variables Over Time')
         ax1.set_xlabel('Day')
@@ -425,17 +582,12 @@ class CFARReportGenerator:
         ax1.grid(True, alpha=0.3)
         
         # Control actions
-        uC_values = [day['control']['uC'] for day in self.df.to_dict('records')]
-        uA_values = [day['control']['uA'] for day in self.df.to_dict('records')]
-        uF_values = [day['control']['uF'] for day in self.df.to_dict('records')]
-        
-        ax2.plot(days, uC_values, label='Structural (uC)', color='red', linewidth=2)
-        ax2.plot(days, uA_values, label='Attention (uA)', color='blue', linewidth=2)
-        ax2.plot(days, uF_values, label='Fluctuation (uF)', color='purple', linewidth=2)
+        _plot_lines(ax2, days, [control['uC'], control['uA'], control['uF']],
+                    ['red', 'blue', 'purple'], ['Structural (uC)', 'Attention (uA)', 'Fluctuation (uF)'])
         
         # Highlight fluctuation pulses
-        pulse_days = [i for i, uF in enumerate(uF_values) if uF > 0.01]
-        pulse_values = [uF_values[i] for i in pulse_days]
+        pulse_days = self._pulse_days
+        pulse_values = control['uF'][pulse_days]
         ax2.scatter(pulse_days, pulse_values, color='orange', s=50, zorder=5, label='Fluctuation Pulses')
         
         ax2.set_title('Control Actions Over Time')
@@ -445,24 +597,23 @@ class CFARReportGenerator:
         ax2.grid(True, alpha=0.3)
         
         # Resolution parameters
-        delta_Y_min_values = [day['parameters']['delta_Y_min'] for day in self.df.to_dict('records')]
-        ax3.plot(days, delta_Y_min_values, color='brown', linewidth=2)
+        ax3.plot(days, self._arrays['parameters']['delta_Y_min'], color='brown', linewidth=2)
         ax3.set_title('Resolution Limit (ΔY_min) Over Time')
         ax3.set_xlabel('Day')
         ax3.set_ylabel('Minimum Resolvable Change')
         ax3.grid(True, alpha=0.3)
         
         # Control mode timeline
-        control_modes = [day['control']['control_mode'] for day in self.df.to_dict('records')]
-        precision_y = [1 if mode == 'precision' else 0 for mode in control_modes]
-        fluctuation_y = [0 if mode == 'precision' else 1 for mode in control_modes]
+        precision = control['control_mode'] == 'precision'
+        precision_y = precision.astype(int)
+        fluctuation_y = (~precision).astype(int)
         
         ax4.fill_between(days, precision_y, alpha=0.7, color='blue', label='Precision Mode')
         ax4.fill_between(days, fluctuation_y, alpha=0.7, color='purple', label='Fluctuation Mode')
         
-        # Mark fluctuation pulses
-        for day in pulse_days:
-            ax4.axvline(x=day, color='orange', linestyle='--', alpha=0.8)
+        # Mark fluctuation pulses (one collection spanning the full axes height)
+        ax4.vlines(pulse_days, 0, 1, transform=ax4.get_xaxis_transform(),
+                   color='orange', linestyle='--', alpha=0.8)
         
         ax4.set_title('Control Mode Timeline')
         ax4.set_xlabel('Day')
@@ -470,37 +621,26 @@ class CFARReportGenerator:
         ax4.set_ylim(-0.1, 1.1)
         ax4.legend()
         
-        plt.tight_layout()
         overview_path = self.output_dir / 'performance_overview.png'
-        plt.savefig(overview_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(overview_path, dpi=dpi)
+        plt.close(fig)
         plot_files['overview'] = str(overview_path)
         
+        self._plots = (dpi, plot_files)
         return plot_files
     
-    def export_html_report(self) -> str:
-        """Generate comprehensive HTML report"""
+    def export_html_report(self, dpi: int = 150) -> str:
+        """Generate comprehensive HTML report (plots saved at the given dpi)"""
         
-        plots = self.generate_plots()
+        plots = self.generate_plots(dpi)
         
-        html_content = f"""
+        # Collect the page in chunks and join once (no repeated string concatenation)
+        html_parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
             <title>CFAR Framework Simulation Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-                .header {{ background: #f4f4f4; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 30px 0; }}
-                .metric {{ background: #e9f5ff; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-                .insight {{ background: #f0f8e9; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-                .recommendation {{ background: #fff3cd; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-                .plot {{ text-align: center; margin: 20px 0; }}
-                table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-                .grade {{ font-size: 2em; font-weight: bold; color: #2e7d32; }}
-            </style>
+            {REPORT_STYLE}
         </head>
         <body>
             <div class="header">
@@ -549,22 +689,22 @@ class CFARReportGenerator:
             
             <div class="section">
                 <h2>🔍 Key Insights</h2>
-        """
+        """]
         
-        for insight in self.analysis['insights']:
-            html_content += f'<div class="insight">{insight}</div>\n'
+        html_parts.append(''.join(f'<div class="insight">{insight}</div>\n'
+                                  for insight in self.analysis['insights']))
         
-        html_content += f"""
+        html_parts.append(f"""
             </div>
             
             <div class="section">
                 <h2>💡 Recommendations</h2>
-        """
+        """)
         
-        for rec in self.analysis['recommendations']:
-            html_content += f'<div class="recommendation">{rec}</div>\n'
+        html_parts.append(''.join(f'<div class="recommendation">{rec}</div>\n'
+                                  for rec in self.analysis['recommendations']))
         
-        html_content += f"""
+        html_parts.append(f"""
             </div>
             
             <div class="section">
@@ -588,27 +728,18 @@ class CFARReportGenerator:
                 <h3>Performance Phases</h3>
                 <table>
                     <tr><th>Phase</th><th>Start Day</th><th>Duration</th><th>Description</th></tr>
-        """
+        """)
         
-        phase_descriptions = {
-            'building': 'Building toward target performance',
-            'approaching': 'Approaching target range',
-            'achieved': 'Target performance achieved',
-            'near_target': 'Near target but not fully achieved'
-        }
-        
-        for phase in self.analysis['performance']['phases']:
-            desc = phase_descriptions.get(phase['phase'], phase['phase'].replace('_', ' ').title())
-            html_content += f"""
+        html_parts.append(''.join(f"""
                     <tr>
                         <td>{phase['phase'].replace('_', ' ').title()}</td>
                         <td>{phase['start_day']}</td>
                         <td>{phase['duration']} days</td>
-                        <td>{desc}</td>
+                        <td>{PHASE_DESCRIPTIONS.get(phase['phase'], phase['phase'].replace('_', ' ').title())}</td>
                     </tr>
-            """
+            """ for phase in self.analysis['performance']['phases']))
         
-        html_content += """
+        html_parts.append("""
                 </table>
             </div>
             
@@ -616,7 +747,7 @@ class CFARReportGenerator:
                 <h2>📋 Simulation Configuration</h2>
                 <table>
                     <tr><th>Parameter</th><th>Value</th></tr>
-        """
+        """)
         
         # Add key configuration parameters
         config_items = [
@@ -628,10 +759,10 @@ class CFARReportGenerator:
             ('Attention Threshold', f"{self.results['parameters']['fluctuation']['A_threshold']:.1%}"),
         ]
         
-        for param, value in config_items:
-            html_content += f"<tr><td>{param}</td><td>{value}</td></tr>\n"
+        html_parts.append(''.join(f"<tr><td>{param}</td><td>{value}</td></tr>\n"
+                                  for param, value in config_items))
         
-        html_content += """
+        html_parts.append("""
                 </table>
             </div>
             
@@ -641,12 +772,12 @@ class CFARReportGenerator:
             </footer>
         </body>
         </html>
-        """
+        """)
         
         # Save HTML report
         html_file = self.output_dir / 'simulation_report.html'
         with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(''.join(html_parts))
         
         return str(html_file)
     
@@ -661,38 +792,57 @@ class CFARReportGenerator:
         }
         
         json_file = self.output_dir / 'analysis_summary.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            json_file.write_bytes(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(summary_data, f, indent=2)
         
         return str(json_file)
     
-    def export_csv_data(self) -> str:
-        """Export processed data as CSV"""
+    def _flat_columns(self) -> Dict[str, Any]:
+        """Flat per-day export columns (same schema as the nested records)"""
+        
+        # Every column comes straight from the prebuilt arrays; no per-row dicts
+        state = self._arrays['state']
+        control = self._arrays['control']
+        params = self._arrays['parameters']
+        columns = {'day': self._arrays['day']}
+        columns.update({f'state_{var}': state[var] for var in ['Y', 'N', 'A', 'C', 'B']})
+        columns.update({f'control_{var}': control[var] for var in ['uC', 'uA', 'uF', 'control_mode']})
+        columns['control_arm_name'] = control['arm_name']
+        columns.update({f'param_{var}': params[var] for var in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']})
+        
+        return columns
+    
+    def export_parquet_data(self) -> str:
+        """Export processed data as snappy-compressed Parquet (requires pyarrow)"""
         
-        # Flatten the nested data structure
-        flattened_data = []
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet export. Install with: pip install pyarrow")
         
-        for day_data in self.df.to_dict('records'):
-            row = {'day': day_data['day']}
-            
-            # Add state variables
-            for var in ['Y', 'N', 'A', 'C', 'B']:
-                row[f'state_{var}'] = day_data['state'][var]
-            
-            # Add control variables
-            for var in ['uC', 'uA', 'uF', 'control_mode', 'arm_name']:
-                row[f'control_{var}'] = day_data['control'][var]
-            
-            # Add parameters
-            for var in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']:
-                row[f'param_{var}'] = day_data['parameters'][var]
-            
-            flattened_data.append(row)
+        table = pa.Table.from_pydict(self._flat_columns())
+        parquet_file = self.output_dir / 'simulation_data.parquet'
+        pq.write_table(table, parquet_file, compression='snappy')
+        
+        return str(parquet_file)
+    
+    def export_csv_data(self) -> str:
+        """Export processed data as CSV"""
         
-        # Create DataFrame and save
-        df_flat = pd.DataFrame(flattened_data)
         csv_file = self.output_dir / 'simulation_data.csv'
-        df_flat.to_csv(csv_file, index=False)
+        
+        if PYARROW_AVAILABLE:
+            # Vectorized C++ writer straight from the column arrays
+            table = pa.Table.from_pydict(self._flat_columns())
+            pa_csv.write_csv(table, str(csv_file), write_options=pa_csv.WriteOptions(quoting_style='needed'))
+        else:
+            # Write the columns row-wise with csv.writer (quotes any arm name that needs it)
+            columns = self._flat_columns()
+            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(columns)
+                writer.writerows(zip(*(np.asarray(values).tolist() for values in columns.values())))
         
         return str(csv_file)
 
@@ -702,8 +852,12 @@ def main():
     parser.add_argument("results_file", help="Path to simulation results JSON file")
     parser.add_argument("--html", action="store_true", help="Generate HTML report")
     parser.add_argument("--json", action="store_true", help="Generate JSON analysis summary")
-    parser.add_argument("--csv", action="store_true", help="Generate CSV data export")
+    parser.add_argument("--csv", action="store_true",
+                        help="Generate data export (Parquet when pyarrow is installed, otherwise CSV)")
+    parser.add_argument("--csv-legacy", action="store_true", help="Generate plain-text CSV data export")
     parser.add_argument("--all", action="store_true", help="Generate all report formats")
+    parser.add_argument("--dpi", type=int, default=150,
+                        help="Resolution of saved plots (default: 150 for drafts, use 300 for final reports)")
     
     args = parser.parse_args()
     
@@ -714,7 +868,7 @@ def main():
     
     # Generate requested formats
     if args.html or args.all:
-        html_file = generator.export_html_report()
+        html_file = generator.export_html_report(args.dpi)
         generated_files.append(f"HTML Report: {html_file}")
     
     if args.json or args.all:
@@ -722,12 +876,20 @@ def main():
         generated_files.append(f"JSON Summary: {json_file}")
     
     if args.csv or args.all:
+        if PYARROW_AVAILABLE:
+            parquet_file = generator.export_parquet_data()
+            generated_files.append(f"Parquet Data: {parquet_file}")
+        else:
+            print("Note: pyarrow not installed, falling back to CSV export.")
+            args.csv_legacy = True
+    
+    if args.csv_legacy:
         csv_file = generator.export_csv_data()
         generated_files.append(f"CSV Data: {csv_file}")
     
-    if not any([args.html, args.json, args.csv, args.all]):
+    if not any([args.html, args.json, args.csv, args.csv_legacy, args.all]):
         # Default to HTML if no format specified
-        html_file = generator.export_html_report()
+        html_file = generator.export_html_report(args.dpi)
         generated_files.append(f"HTML Report: {html_file}")
     
     print("🎯 CFAR Framework Report Generation Complete!")
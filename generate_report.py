@@ -5,6 +5,7 @@ CFAR Framework Report Generator Launcher
 Quick launcher for generating comprehensive simulation reports
 """
 
+import os
 import sys
 import subprocess
 from pathlib import Path
@@ -19,7 +20,8 @@ def main():
         print("Options:")
         print("  --html    Generate HTML report (default)")
         print("  --json    Generate JSON analysis summary")
-        print("  --csv     Generate CSV data export")
+        print("  --csv     Generate data export (Parquet with pyarrow, else CSV)")
+        print("  --csv-legacy  Generate plain-text CSV data export")
         print("  --all     Generate all formats")
         print()
         print("Example:")
@@ -27,9 +29,14 @@ def main():
         return
     
     # Pass all arguments to the report generator
-    args = ["python", "examples/report_generator.py"] + sys.argv[1:]
+    args = [sys.executable, "examples/report_generator.py"] + sys.argv[1:]
     
     try:
+        if os.name != "nt":
+            # Replace this process with the generator (it prints its own summary)
+            os.execvp(args[0], args)
+        
+        # No real exec on Windows; keep the child process there
         result = subprocess.run(args, cwd=Path.cwd())
         if result.returncode == 0:
             print("\n✅ Report generation completed successfully!")
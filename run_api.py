@@ -5,6 +5,8 @@ CFAR Framework API Server Launcher
 Quick launcher for the FastAPI backend server
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -23,13 +25,33 @@ def main():
         print("⏹️  Press Ctrl+C to stop the server")
         print()
         
-        subprocess.run([
+        cmd = [
             sys.executable, "-m", "uvicorn", 
             "ui.api.main:app",
             "--host", "0.0.0.0",
             "--port", "8000",
-            "--reload"
-        ], cwd=project_root)
+        ]
+        
+        # uvloop event loop and httptools parser when installed (uvicorn[standard])
+        if importlib.util.find_spec("uvloop"):
+            cmd += ["--loop", "uvloop"]
+        if importlib.util.find_spec("httptools"):
+            cmd += ["--http", "httptools"]
+        
+        # CFAR_API_RELOAD=1 for development (auto-reload runs a single worker);
+        # job state is in-process, so extra workers need CFAR_API_WORKERS set explicitly
+        if os.environ.get("CFAR_API_RELOAD") == "1":
+            cmd.append("--reload")
+        else:
+            cmd += ["--workers", os.environ.get("CFAR_API_WORKERS", "1")]
+        
+        if os.name == "nt":
+            # No real exec on Windows; keep the child process there
+            subprocess.run(cmd, cwd=project_root)
+        else:
+            # Replace this process with the server (no idle parent; Ctrl+C goes straight to it)
+            os.chdir(project_root)
+            os.execvp(cmd[0], cmd)
         
     except KeyboardInterrupt:
         print("\n👋 API server stopped by user")
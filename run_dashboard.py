@@ -5,6 +5,7 @@ CFAR Framework Dashboard Launcher
 Quick launcher for the Streamlit dashboard
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -22,12 +23,20 @@ def main():
         print("⏹️  Press Ctrl+C to stop the dashboard")
         print()
         
-        subprocess.run([
+        cmd = [
             sys.executable, "-m", "streamlit", "run", 
             str(project_root / "ui" / "streamlit_app.py"),
             "--server.port", "8501",
             "--server.headless", "false"
-        ], cwd=project_root)
+        ]
+        
+        if os.name == "nt":
+            # No real exec on Windows; keep the child process there
+            subprocess.run(cmd, cwd=project_root)
+        else:
+            # Replace this process with the dashboard (no idle parent; Ctrl+C goes straight to it)
+            os.chdir(project_root)
+            os.execvp(cmd[0], cmd)
         
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user")
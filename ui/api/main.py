@@ -4,18 +4,75 @@ FastAPI Backend for CFAR Framework
 REST API for simulation control, configuration management, and data access
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile
+from fastapi import FastAPI, HTTPException, File, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import Dict, List, Optional, Any
 import json
 import yaml
-import subprocess
+import asyncio
+import gzip
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import os
 from pathlib import Path
 import uuid
 from datetime import datetime
+from collections import OrderedDict, deque
+from functools import partial
+from itertools import islice
+
+# Field validators: pydantic v2 name, with the v1 equivalent as fallback
+try:
+    from pydantic import field_validator
+except ImportError:
+    from pydantic import validator as field_validator
+
+# Try to import orjson for faster JSON parsing/serialization
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for reading result summaries without parsing simulation_data
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Try to import cachetools for the size-capped results cache
+try:
+    from cachetools import LRUCache
+except ImportError:
+    class LRUCache(OrderedDict):
+        """Minimal size-capped mapping that evicts the least recently used entry"""
+        
+        def __init__(self, maxsize: int):
+            super().__init__()
+            self.maxsize = maxsize
+        
+        def __getitem__(self, key):
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+        
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+# Try to import pyarrow for the Parquet results cache
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Import CFAR Framework components
 import sys
@@ -23,11 +80,16 @@ sys.path.append(str(Path(__file__).parent.parent.parent / "engine"))
 from resolution_engine.state import State
 from resolution_engine.dynamics import step
 from resolution_engine.controller_fluctuation import FluctuationController
+from cli import run_config
+
+# Response class for routes that return trusted in-memory data directly
+ResponseClass = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 
 app = FastAPI(
     title="CFAR Framework API",
     description="REST API for Constraint-Fluctuation-Attention-Resolution Framework",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ResponseClass
 )
 
 # Enable CORS for web frontend
@@ -39,14 +101,273 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory storage for simulation jobs (use database in production)
+# In-memory storage for simulation jobs (use database in production); insertion
+# order is creation order, so the newest jobs are at the end
 simulation_jobs = {}
-simulation_results = {}
+
+# Jobs per status, kept in step with simulation_jobs so /health never scans it
+job_counts = {"pending": 0, "running": 0, "completed": 0, "failed": 0}
+
+
+def set_job_status(job: Dict[str, Any], status: str):
+    """Move a stored job to a new status, updating job_counts"""
+    job_counts[job["status"]] -= 1
+    job_counts[status] += 1
+    job["status"] = status
+
+# Loaded results keyed by result path, capped so server memory stays flat over job history
+simulation_results = LRUCache(maxsize=8)
+result_summaries = LRUCache(maxsize=64)
+
+# Worker processes for the CPU-bound simulations (created at startup)
+SIMULATION_WORKERS = os.cpu_count() or 1
+executor: Optional[ProcessPoolExecutor] = None
+
+# IDs of submitted jobs whose worker run has not finished, in submission order. The
+# pool starts work first-in first-out, so the first SIMULATION_WORKERS are the ones
+# running; the rest are still queued (deleted jobs stay until their run ends)
+job_queue: deque = deque()
+
+# Finished job results (<job_id>.json.gz plus its Parquet cache), published atomically
+RESULTS_DIR = Path(tempfile.gettempdir()) / "cfar_api_results"
+
+# Cheap compression level for result files (float-heavy JSON still shrinks ~4x)
+RESULT_GZIP_LEVEL = 3
+
+# Per-job comparison rows, computed once at completion. Kept in memory only, like
+# simulation_jobs itself, so it never outlives the jobs it describes
+comparison_index: Dict[str, Dict[str, Any]] = {}
+
+# Rows serialized per chunk by the streaming result endpoints
+RESULT_BATCH_SIZE = 1000
+
+# Results with at least this many days are always streamed in batches, never loaded whole
+RESULT_STREAM_THRESHOLD = 2000
+
+
+def open_result(path):
+    """Open a JSON file for binary reading, decompressing .gz files transparently"""
+    return gzip.open(path, 'rb') if str(path).endswith(".gz") else open(path, 'rb')
+
+
+def read_json(path) -> Any:
+    """Parse a JSON file (optionally gzipped), with orjson when it is installed"""
+    with open_result(path) as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib json also accepts the NaN/Infinity literals it writes
+            pass
+    return json.loads(data)
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _parquet_path(result_path: str) -> Path:
+    """Parquet copy of a result file's simulation_data"""
+    return Path(result_path + ".parquet")
+
+
+def _sidecar_path(result_path: str) -> Path:
+    """Small JSON sidecar holding a result file's metadata and summary"""
+    return Path(result_path + ".meta.json")
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Publish data at path all-or-nothing: write <path>.part, fsync it, then rename into place
+    
+    Args:
+        path: Final file path
+        data: File contents
+    """
+    part = path.with_name(path.name + ".part")
+    with open(part, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(part, path)
+
+
+def save_result(result_path: str, results: Dict[str, Any]):
+    """
+    Write a finished job's results to disk, plus the Parquet cache when pyarrow is installed
+    
+    The cache files are written first, so once the JSON exists everything is in place.
+    
+    Args:
+        result_path: Output JSON path
+        results: Results dictionary returned by the engine
+    """
+    if PYARROW_AVAILABLE:
+        write_result_cache(result_path, results)
+    data = dump_json(results)
+    if result_path.endswith(".gz"):
+        data = gzip.compress(data, compresslevel=RESULT_GZIP_LEVEL)
+    write_atomic(Path(result_path), data)
+
+
+def write_result_cache(result_path: str, results: Optional[Dict[str, Any]] = None):
+    """
+    Store the per-day rows as Parquet and the metadata/summary as a JSON sidecar
+    
+    Later requests read these instead of re-parsing the full result JSON.
+    
+    Args:
+        result_path: Path to the engine's JSON output
+        results: Already-loaded results (read from result_path when omitted)
+    """
+    if results is None:
+        results = read_json(result_path)
+    
+    parquet_path = _parquet_path(result_path)
+    part = parquet_path.with_name(parquet_path.name + ".part")
+    pq.write_table(pa.Table.from_pylist(results["simulation_data"]), part)
+    os.replace(part, parquet_path)
+    write_atomic(_sidecar_path(result_path),
+                 dump_json({"metadata": results["metadata"], "summary": results["summary"]}))
+
+
+def comparison_row(job_id: str, results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the compare_simulations metrics from a result's metadata and summary
+    
+    Args:
+        job_id: Simulation job ID
+        results: Dictionary with at least 'metadata' and 'summary'
+    
+    Returns:
+        Comparison row (without created_at, which lives on the job record)
+    """
+    summary = results["summary"]
+    mode_usage = summary.get("control_mode_usage", {})
+    return {
+        "job_id": job_id,
+        "target_Y": results["metadata"]["target_Y"],
+        "final_Y": summary["final_state"]["Y"],
+        "final_error": summary["final_error"],
+        "target_achieved": summary["target_achieved"],
+        "max_Y": summary["max_Y_achieved"],
+        "days_above_target": summary["days_above_target"],
+        "precision_days": mode_usage.get("precision_days", 0),
+        "fluctuation_days": mode_usage.get("fluctuation_days", 0),
+        "fluctuation_pulses": summary.get("total_fluctuation_pulses", 0),
+    }
+
+
+def load_result(result_path: str) -> Dict[str, Any]:
+    """Load a full result file (the most recent few are kept in memory)"""
+    if result_path not in simulation_results:
+        simulation_results[result_path] = read_json(result_path)
+    return simulation_results[result_path]
+
+
+def read_result_summary(result_path: str) -> Dict[str, Any]:
+    """Read only the metadata and summary of a result from disk (no caching; thread-safe)"""
+    sidecar = _sidecar_path(result_path)
+    if sidecar.exists():
+        return read_json(sidecar)
+    
+    if IJSON_AVAILABLE:
+        # Stream just the two top-level keys; simulation_data is skipped, never built
+        summary = {}
+        with open_result(result_path) as f:
+            for key in ("metadata", "summary"):
+                f.seek(0)
+                summary[key] = next(ijson.items(f, key, use_float=True))
+        return summary
+    
+    # Full parse, but only the small part is returned
+    results = read_json(result_path)
+    return {"metadata": results["metadata"], "summary": results["summary"]}
+
+
+def load_result_summary(result_path: str) -> Dict[str, Any]:
+    """Load only the metadata and summary of a result, through the summary cache"""
+    if result_path not in result_summaries:
+        result_summaries[result_path] = read_result_summary(result_path)
+    return result_summaries[result_path]
+
+
+def iter_result_batches(result_path: str):
+    """
+    Yield a result's simulation_data in lists of up to RESULT_BATCH_SIZE rows
+    
+    Reads the Parquet cache when present, else streams the JSON with ijson, and only
+    falls back to loading the whole file when neither is available.
+    
+    Args:
+        result_path: Path to the engine's JSON output
+    
+    Yields:
+        Lists of per-day row dictionaries
+    """
+    if PYARROW_AVAILABLE and _parquet_path(result_path).exists():
+        for batch in pq.ParquetFile(_parquet_path(result_path)).iter_batches(batch_size=RESULT_BATCH_SIZE):
+            yield batch.to_pylist()
+    elif IJSON_AVAILABLE:
+        with open_result(result_path) as f:
+            rows = ijson.items(f, "simulation_data.item", use_float=True)
+            while True:
+                batch = list(islice(rows, RESULT_BATCH_SIZE))
+                if not batch:
+                    break
+                yield batch
+    else:
+        rows = load_result(result_path)["simulation_data"]
+        for start in range(0, len(rows), RESULT_BATCH_SIZE):
+            yield rows[start:start + RESULT_BATCH_SIZE]
+
+
+def stream_result(job_id: str, result_path: str):
+    """
+    Yield a result as JSON text, serializing simulation_data in batches
+    
+    Args:
+        job_id: Simulation job ID
+        result_path: Path to the engine's JSON output
+    
+    Yields:
+        Byte chunks of the same JSON document the non-streaming path returns
+    """
+    head = dict(job_id=job_id, **load_result_summary(result_path))
+    yield dump_json(head)[:-1] + b', "simulation_data": ['
+    
+    first = True
+    for batch in iter_result_batches(result_path):
+        rows = b", ".join(dump_json(row) for row in batch)
+        if rows:
+            yield rows if first else b", " + rows
+            first = False
+    
+    yield b"]}"
+
+
+def stream_result_ndjson(result_path: str):
+    """
+    Yield a result's simulation_data as newline-delimited JSON, one chunk per batch
+    
+    Args:
+        result_path: Path to the engine's JSON output
+    
+    Yields:
+        Byte chunks of one JSON object per line
+    """
+    for batch in iter_result_batches(result_path):
+        yield b"".join(dump_json(row) + b"\n" for row in batch)
+
 
 # Pydantic models for API
 class SimulationConfig(BaseModel):
-    target_Y: float
-    horizon_days: int
+    target_Y: float = Field(..., ge=0, le=1)
+    horizon_days: int = Field(..., gt=0)
     init_state: Dict[str, float]
     pid: Dict[str, float]
     fluctuation: Dict[str, Any]
@@ -55,6 +376,30 @@ class SimulationConfig(BaseModel):
     lambda_inputs: Dict[str, Any]
     k1_inputs: Dict[str, Any]
     reward_threshold: float
+    
+    @field_validator('init_state')
+    def check_init_state(cls, v):
+        errors = []
+        for var in ('Y', 'N', 'A', 'C', 'B'):
+            if var not in v:
+                errors.append(f"Missing initial state variable: {var}")
+            elif not 0 <= v[var] <= 1:
+                errors.append(f"Initial state {var} must be between 0 and 1")
+        if errors:
+            raise ValueError("; ".join(errors))
+        return v
+    
+    @field_validator('pid')
+    def check_pid_gains(cls, v):
+        errors = []
+        for gain in ('kp', 'ki', 'kd'):
+            if gain not in v:
+                errors.append(f"Missing PID gain: {gain}")
+            elif v[gain] < 0:
+                errors.append(f"PID gain {gain} must be non-negative")
+        if errors:
+            raise ValueError("; ".join(errors))
+        return v
 
 class SimulationJob(BaseModel):
     job_id: str
@@ -70,6 +415,20 @@ class SimulationResult(BaseModel):
     summary: Dict[str, Any]
     simulation_data: List[Dict[str, Any]]
 
+@app.on_event("startup")
+async def start_executor():
+    """Start the simulation worker pool"""
+    global executor
+    executor = ProcessPoolExecutor(max_workers=SIMULATION_WORKERS)
+
+
+@app.on_event("shutdown")
+async def stop_executor():
+    """Stop the simulation worker pool"""
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
 @app.get("/")
 async def root():
     """API health check"""
@@ -85,14 +444,17 @@ async def health_check():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "active_jobs": len([j for j in simulation_jobs.values() if j["status"] == "running"]),
-        "completed_jobs": len([j for j in simulation_jobs.values() if j["status"] == "completed"]),
+        "active_jobs": job_counts["running"],
+        "completed_jobs": job_counts["completed"],
         "total_jobs": len(simulation_jobs),
+        "job_counts": dict(job_counts),
         "timestamp": datetime.now().isoformat()
     }
 
-@app.post("/simulations/", response_model=SimulationJob)
-async def create_simulation(config: SimulationConfig, background_tasks: BackgroundTasks):
+# Job records are built here from validated configs, so the job routes return them
+# directly: no per-job model construction or response validation pass
+@app.post("/simulations/", response_model=None, responses={200: {"model": SimulationJob}})
+async def create_simulation(config: SimulationConfig):
     """Create and start a new simulation job"""
     
     # Generate unique job ID
@@ -109,13 +471,19 @@ async def create_simulation(config: SimulationConfig, background_tasks: Backgrou
     }
     
     simulation_jobs[job_id] = job
+    job_counts["pending"] += 1
+    response = ResponseClass(dict(job))
     
-    # Start simulation in background
-    background_tasks.add_task(run_simulation_job, job_id)
+    # Run the simulation in a worker process so the event loop stays responsive
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, run_simulation_worker, job_id, job["config"])
+    future.add_done_callback(partial(finalize_simulation_job, job_id))
+    job_queue.append(job_id)
+    mark_running_jobs()
     
-    return SimulationJob(**job)
+    return response
 
-@app.get("/simulations/{job_id}", response_model=SimulationJob)
+@app.get("/simulations/{job_id}", response_model=None, responses={200: {"model": SimulationJob}})
 async def get_simulation_job(job_id: str):
     """Get simulation job status"""
     
@@ -123,11 +491,11 @@ async def get_simulation_job(job_id: str):
         raise HTTPException(status_code=404, detail="Simulation job not found")
     
     job = simulation_jobs[job_id]
-    return SimulationJob(**job)
+    return ResponseClass(job)
 
 @app.get("/simulations/{job_id}/result", response_model=SimulationResult)
-async def get_simulation_result(job_id: str):
-    """Get simulation results"""
+async def get_simulation_result(job_id: str, request: Request, raw: bool = False):
+    """Get simulation results (raw=true sends the engine's result file as-is, without job_id)"""
     
     if job_id not in simulation_jobs:
         raise HTTPException(status_code=404, detail="Simulation job not found")
@@ -137,28 +505,56 @@ async def get_simulation_result(job_id: str):
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail=f"Simulation not completed. Status: {job['status']}")
     
-    if job_id in simulation_results:
-        return SimulationResult(job_id=job_id, **simulation_results[job_id])
+    result_path = job["result_path"]
+    if not result_path or not Path(result_path).exists():
+        raise HTTPException(status_code=500, detail="Results not available")
+    
+    # Raw file: no parse, validation or re-serialization
+    if raw:
+        if not result_path.endswith(".gz"):
+            return FileResponse(result_path, media_type="application/json")
+        # Label the gzipped file as JSON only for clients that accept gzip encoding;
+        # everyone else gets it as a .json.gz download
+        if "gzip" in request.headers.get("accept-encoding", "").lower():
+            return FileResponse(result_path, media_type="application/json",
+                                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        return FileResponse(result_path, media_type="application/gzip", filename=f"{job_id}.json.gz",
+                            headers={"Vary": "Accept-Encoding"})
+    
+    # Stream the same JSON document in batches from the Parquet cache when it was
+    # written, and for long runs whatever the source, so those are never loaded whole
+    if ((PYARROW_AVAILABLE and _parquet_path(result_path).exists())
+            or load_result_summary(result_path)["metadata"]["horizon_days"] >= RESULT_STREAM_THRESHOLD):
+        return StreamingResponse(stream_result(job_id, result_path), media_type="application/json")
     
     # Load results from file
-    if job["result_path"] and Path(job["result_path"]).exists():
-        with open(job["result_path"], 'r') as f:
-            results = json.load(f)
-        
-        simulation_results[job_id] = results
-        return SimulationResult(job_id=job_id, **results)
-    
-    raise HTTPException(status_code=500, detail="Results not available")
+    return SimulationResult(job_id=job_id, **load_result(result_path))
 
-@app.get("/simulations/", response_model=List[SimulationJob])
-async def list_simulation_jobs():
-    """List all simulation jobs"""
+@app.get("/simulations/{job_id}/result/stream")
+async def stream_simulation_result(job_id: str):
+    """Stream simulation_data as newline-delimited JSON (one day per line)"""
     
-    jobs = []
-    for job_data in simulation_jobs.values():
-        jobs.append(SimulationJob(**job_data))
+    if job_id not in simulation_jobs:
+        raise HTTPException(status_code=404, detail="Simulation job not found")
+    
+    job = simulation_jobs[job_id]
     
-    return sorted(jobs, key=lambda x: x.created_at, reverse=True)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=400, detail=f"Simulation not completed. Status: {job['status']}")
+    
+    result_path = job["result_path"]
+    if not result_path or not Path(result_path).exists():
+        raise HTTPException(status_code=500, detail="Results not available")
+    
+    return StreamingResponse(stream_result_ndjson(result_path), media_type="application/x-ndjson")
+
+@app.get("/simulations/", response_model=None, responses={200: {"model": List[SimulationJob]}})
+async def list_simulation_jobs(offset: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000)):
+    """List simulation jobs, newest first, one page at a time"""
+    
+    # Walk the creation-ordered table backwards and stop after the requested page
+    jobs = list(islice(reversed(simulation_jobs.values()), offset, offset + limit))
+    return ResponseClass(jobs)
 
 @app.delete("/simulations/{job_id}")
 async def delete_simulation_job(job_id: str):
@@ -169,14 +565,17 @@ async def delete_simulation_job(job_id: str):
     
     job = simulation_jobs[job_id]
     
-    # Clean up result file
-    if job["result_path"] and Path(job["result_path"]).exists():
-        os.remove(job["result_path"])
+    # Clean up result file and its Parquet cache
+    if job["result_path"]:
+        remove_result_files(job["result_path"])
     
     # Remove from memory
     del simulation_jobs[job_id]
-    if job_id in simulation_results:
-        del simulation_results[job_id]
+    job_counts[job["status"]] -= 1
+    comparison_index.pop(job_id, None)
+    if job["result_path"]:
+        simulation_results.pop(job["result_path"], None)
+        result_summaries.pop(job["result_path"], None)
     
     return {"message": "Simulation job deleted successfully"}
 
@@ -195,38 +594,17 @@ async def get_default_config():
     return config
 
 @app.post("/configs/validate")
-async def validate_config(config: SimulationConfig):
+async def validate_config(config: Dict[str, Any]):
     """Validate a simulation configuration"""
     
+    # Same model validation create_simulation applies, reported instead of rejected
     try:
-        # Basic validation
-        errors = []
-        
-        if not 0 <= config.target_Y <= 1:
-            errors.append("target_Y must be between 0 and 1")
-        
-        if config.horizon_days <= 0:
-            errors.append("horizon_days must be positive")
-        
-        # Validate initial state
-        required_state_vars = ['Y', 'N', 'A', 'C', 'B']
-        for var in required_state_vars:
-            if var not in config.init_state:
-                errors.append(f"Missing initial state variable: {var}")
-            elif not 0 <= config.init_state[var] <= 1:
-                errors.append(f"Initial state {var} must be between 0 and 1")
-        
-        # Validate PID parameters
-        if config.pid['kp'] < 0 or config.pid['ki'] < 0 or config.pid['kd'] < 0:
-            errors.append("PID gains must be non-negative")
-        
-        if errors:
-            return {"valid": False, "errors": errors}
-        else:
-            return {"valid": True, "message": "Configuration is valid"}
-            
-    except Exception as e:
-        return {"valid": False, "errors": [f"Validation error: {str(e)}"]}
+        SimulationConfig(**config)
+    except ValidationError as e:
+        errors = [f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()]
+        return {"valid": False, "errors": errors}
+    
+    return {"valid": True, "message": "Configuration is valid"}
 
 @app.post("/analysis/compare")
 async def compare_simulations(job_ids: List[str]):
@@ -235,8 +613,6 @@ async def compare_simulations(job_ids: List[str]):
     if len(job_ids) < 2:
         raise HTTPException(status_code=400, detail="At least 2 simulations required for comparison")
     
-    comparison_data = []
-    
     for job_id in job_ids:
         if job_id not in simulation_jobs:
             raise HTTPException(status_code=404, detail=f"Simulation job {job_id} not found")
@@ -244,29 +620,23 @@ async def compare_simulations(job_ids: List[str]):
         job = simulation_jobs[job_id]
         if job["status"] != "completed":
             raise HTTPException(status_code=400, detail=f"Simulation {job_id} not completed")
-        
-        # Get results
-        if job_id in simulation_results:
-            results = simulation_results[job_id]
-        else:
-            with open(job["result_path"], 'r') as f:
-                results = json.load(f)
-                simulation_results[job_id] = results
-        
-        # Extract comparison metrics
-        comparison_data.append({
-            "job_id": job_id,
-            "target_Y": results["metadata"]["target_Y"],
-            "final_Y": results["summary"]["final_state"]["Y"],
-            "final_error": results["summary"]["final_error"],
-            "target_achieved": results["summary"]["target_achieved"],
-            "max_Y": results["summary"]["max_Y_achieved"],
-            "days_above_target": results["summary"]["days_above_target"],
-            "precision_days": results["summary"].get("control_mode_usage", {}).get("precision_days", 0),
-            "fluctuation_days": results["summary"].get("control_mode_usage", {}).get("fluctuation_days", 0),
-            "fluctuation_pulses": results["summary"].get("total_fluctuation_pulses", 0),
-            "created_at": simulation_jobs[job_id]["created_at"]
-        })
+    
+    # Rows are precomputed at completion; rebuild any missing ones from the result
+    # summaries, reading the files concurrently on the default thread pool
+    missing = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in comparison_index]
+    if missing:
+        loop = asyncio.get_running_loop()
+        summaries = await asyncio.gather(*(
+            loop.run_in_executor(None, read_result_summary, simulation_jobs[job_id]["result_path"])
+            for job_id in missing
+        ))
+        for job_id, summary in zip(missing, summaries):
+            result_summaries[simulation_jobs[job_id]["result_path"]] = summary
+            row = comparison_row(job_id, summary)
+            row["created_at"] = simulation_jobs[job_id]["created_at"]
+            comparison_index[job_id] = row
+    
+    comparison_data = [comparison_index[job_id] for job_id in job_ids]
     
     return {
         "comparison": comparison_data,
@@ -278,48 +648,68 @@ async def compare_simulations(job_ids: List[str]):
         }
     }
 
-async def run_simulation_job(job_id: str):
-    """Background task to run simulation"""
+def run_simulation_worker(job_id: str, config: Dict[str, Any]):
+    """
+    Run one simulation and persist its results (executes in a worker process)
     
-    job = simulation_jobs[job_id]
-    job["status"] = "running"
+    Only the output path and comparison row are sent back, so the results never
+    cross the process boundary.
+    
+    Args:
+        job_id: Simulation job ID (names the results file)
+        config: Simulation configuration dictionary
+    
+    Returns:
+        Tuple of (path of the saved results JSON, comparison row)
+    """
+    results = run_config(config, quiet=True)
+    
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output_path = str(RESULTS_DIR / f"{job_id}.json.gz")
+    save_result(output_path, results)
+    
+    return output_path, comparison_row(job_id, results)
+
+
+def mark_running_jobs():
+    """Move the jobs that have reached a worker from pending to running"""
+    for job_id in islice(job_queue, SIMULATION_WORKERS):
+        job = simulation_jobs.get(job_id)
+        if job is not None and job["status"] == "pending":
+            set_job_status(job, "running")
+
+
+def remove_result_files(result_path: str):
+    """Delete a result file together with its Parquet cache and sidecar"""
+    for path in (Path(result_path), _parquet_path(result_path), _sidecar_path(result_path)):
+        if path.exists():
+            os.remove(path)
+
+
+def finalize_simulation_job(job_id: str, future: asyncio.Future):
+    """Record the outcome of a finished worker run on its job"""
+    
+    job_queue.remove(job_id)
+    mark_running_jobs()
+    
+    job = simulation_jobs.get(job_id)
+    if job is None:  # deleted while running: drop the files the worker wrote
+        if future.exception() is None:
+            remove_result_files(future.result()[0])
+        return
     
     try:
-        # Create temporary config file
-        config_data = job["config"]
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f, default_flow_style=False)
-            config_path = f.name
-        
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            output_path = f.name
-        
-        # Run simulation
-        project_root = Path(__file__).parent.parent.parent
-        result = subprocess.run([
-            "python", "engine/cli.py", "run",
-            "--config", config_path,
-            "--output", output_path
-        ], capture_output=True, text=True, cwd=project_root,
-           encoding='utf-8', errors='replace')
-        
-        if result.returncode == 0:
-            job["status"] = "completed"
-            job["result_path"] = output_path
-        else:
-            job["status"] = "failed"
-            job["error_message"] = result.stderr or "Unknown error"
-        
-        # Clean up config file
-        os.remove(config_path)
-        
+        result_path, row = future.result()
     except Exception as e:
-        job["status"] = "failed"
+        set_job_status(job, "failed")
         job["error_message"] = str(e)
+        return
     
-    simulation_jobs[job_id] = job
+    row["created_at"] = job["created_at"]
+    comparison_index[job_id] = row
+    
+    job["result_path"] = result_path
+    set_job_status(job, "completed")
 
 if __name__ == "__main__":
     import uvicorn
@@ -5,31 +5,84 @@ Interactive dashboard for Constraint-Fluctuation-Attention-Resolution system mon
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 import json
 import yaml
 from pathlib import Path
-import subprocess
-import tempfile
 import os
+import hashlib
 from datetime import datetime
 import io
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Try to import orjson for faster results parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast LTTB kernel; a NumPy implementation is used otherwise
+try:
+    from tsdownsample import LTTBDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+
+# Optional pyarrow for Parquet results (cli.py --format parquet) and Arrow tables
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional markdown-it-py to pre-render the Documentation page to HTML
+try:
+    from markdown_it import MarkdownIt
+    MARKDOWN_IT_AVAILABLE = True
+except ImportError:
+    MARKDOWN_IT_AVAILABLE = False
+
+# Series longer than this are downsampled before being sent to the browser
+MAX_PLOT_POINTS = 2000
+
+# Plotly modebar config for interactive charts, and for summary charts that
+# need no hover/zoom bindings at all
+PLOTLY_CONFIG = {'displaylogo': False, 'responsive': False}
+STATIC_PLOTLY_CONFIG = {'displaylogo': False, 'staticPlot': True}
+
+# Pixel height of the arm usage chart (embedded as static HTML)
+ARM_USAGE_HEIGHT = 420
+
+# Markdown sources listed on the Documentation page
+DOC_DIRS = [Path(__file__).parent.parent / "docs", Path(__file__).parent.parent / "theory"]
+
+# st.fragment landed in Streamlit 1.37; fall back to the experimental name,
+# or to plain inline rendering on older releases
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
+
 # Import resolution engine components
 import sys
 sys.path.append(str(Path(__file__).parent.parent / "engine"))
-from resolution_engine.state import State
-from resolution_engine.dynamics import step
-from resolution_engine.controller_fluctuation import FluctuationController
+from resolution_engine._compat import NUMBA_AVAILABLE
+from cli import run_config
 
 
 def main():
     """
     Main Streamlit application
     """
+    # Called on every run, not just the first per session: it is a single
+    # message, and skipping it on reruns lets a fresh tab or reconnect fall
+    # back to the default centered layout
     st.set_page_config(
         page_title="CFAR Framework",
         page_icon="🎯",
@@ -41,19 +94,16 @@ def main():
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
-    page = st.sidebar.selectbox(
-        "Choose a page",
-        ["Dashboard", "System Configuration", "Performance Analytics", "Documentation"]
-    )
-    
-    if page == "Dashboard":
-        show_dashboard()
-    elif page == "System Configuration":
-        show_configuration()
-    elif page == "Performance Analytics":
-        show_analytics()
-    elif page == "Documentation":
-        show_documentation()
+    # The page is mirrored into the URL (?page=...) so links and refreshes
+    # reopen it instead of falling back to the Dashboard
+    pages = list(PAGES)
+    requested = st.query_params.get("page", pages[0])
+    page = st.sidebar.selectbox("Choose a page", pages,
+                                index=pages.index(requested) if requested in pages else 0)
+    if st.query_params.get("page") != page:
+        st.query_params["page"] = page
+    
+    PAGES[page]()
 
 
 def show_dashboard():
@@ -67,9 +117,10 @@ def show_dashboard():
     uploaded_file = st.file_uploader("Choose a simulation results file", type=['json'])
     
     if uploaded_file is not None:
-        # Load and display results
-        results = json.load(uploaded_file)
-        display_simulation_results(results)
+        # Load and display results (parsed once per distinct file)
+        file_bytes = uploaded_file.getvalue()
+        results = load_results(file_bytes)
+        display_simulation_results(results, results_key(file_bytes))
     else:
         st.info("Upload a simulation results JSON file to view dashboard")
         
@@ -78,74 +129,200 @@ def show_dashboard():
             run_example_simulation()
 
 
-def display_simulation_results(results):
-    """Display comprehensive dashboard for simulation results"""
+# Parsed results are large; expire them after five minutes and keep a bounded
+# number so switching pages reuses them without growing memory indefinitely
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def load_results(file_bytes: bytes) -> dict:
+    """Parse a simulation results JSON file, memoized on its contents"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(file_bytes)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by the stdlib json fallback; let json handle it
+    return json.loads(file_bytes)
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def load_parquet_results(file_bytes: bytes):
+    """Read a Parquet results file written by ``cli.py --format parquet``
+
+    Returns:
+        Tuple of (results, df): metadata/parameters/summary from the file's
+        schema metadata, and the already-flat per-day columns
+    """
+    table = pq.read_table(io.BytesIO(file_bytes))
+    results = json.loads(table.schema.metadata[b'cfar'])
+    return results, table.to_pandas()
+
+
+def load_run(file):
+    """Load an uploaded JSON or Parquet results file
+
+    Returns:
+        (results, flat DataFrame, results id) - the id is the content hash
+        that keys the cached per-run data
+    """
+    file_bytes = file.getvalue()
+    results_id = results_key(file_bytes)
+    if file.name.endswith('.parquet'):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read Parquet results. Install with: pip install pyarrow")
+        results, df = load_parquet_results(file_bytes)
+        return results, df, results_id
+    results = load_results(file_bytes)
+    return results, build_flat_df(results_id, results['simulation_data']), results_id
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def comparison_trace(results_id: str, _df: pd.DataFrame):
+    """Downsampled (day, state_Y) arrays for one run on the comparison plot
+
+    LTTB is O(N) per run; keyed on the results id it runs once per uploaded
+    file instead of on every rerun of the Analytics page.
+    """
+    return _downsample(_df['day'].to_numpy(), _df['state_Y'].to_numpy())
+
+
+def results_key(data) -> str:
+    """Content hash used to key cached results, frames and figures"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def to_soa(simulation_data):
+    """Transpose per-day records into a dict of column arrays (Struct-of-Arrays)
+
+    Keys follow pd.json_normalize(sep='_') naming (day, state_Y, parameters_k1,
+    control_uF, ...). Numeric fields become typed NumPy arrays, arm names an
+    object array and the control mode a pd.Categorical.
+
+    Args:
+        simulation_data: List of nested per-day records from the results file
+
+    Returns:
+        Dict mapping column name to array
+    """
+    n = len(simulation_data)
+    soa = {'day': np.fromiter((d['day'] for d in simulation_data), dtype=np.int64, count=n)}
+    if not n:
+        return soa
+    
+    for group in ('state', 'parameters', 'control'):
+        for key in simulation_data[0].get(group, {}):
+            values = (d[group][key] for d in simulation_data)
+            if key == 'control_mode':
+                column = pd.Categorical(list(values), categories=['precision', 'fluctuation'])
+            elif key == 'arm_name':
+                column = np.array(list(values), dtype=object)
+            else:
+                column = np.fromiter(values, dtype=np.int64 if key == 'selected_arm' else float, count=n)
+            soa[f'{group}_{key}'] = column
+    
+    return soa
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def build_soa(results_id: str, _simulation_data: list) -> dict:
+    """Column arrays for a results file (see to_soa)
+
+    The records themselves are not hashed; ``results_id`` identifies them.
+    """
+    return to_soa(_simulation_data)
+
+
+def build_flat_df(results_id: str, simulation_data: list) -> pd.DataFrame:
+    """Flat per-day DataFrame (state_Y, control_uF, ...) over the cached column arrays"""
+    return pd.DataFrame(build_soa(results_id, simulation_data))
+
+
+def display_simulation_results(results, results_id=None):
+    """Display comprehensive dashboard for simulation results
+
+    Each section is a fragment, so a widget inside one (e.g. the export
+    buttons) reruns only that section rather than the whole page.
+    """
     
-    # Extract key metrics
-    metadata = results['metadata']
     summary = results['summary']
     simulation_data = results['simulation_data']
     
+    _metrics_fragment(results['metadata'], summary)
+    
+    # Transpose nested state/control records into column arrays (state_Y, control_uF, ...)
+    if results_id is None:
+        soa = to_soa(simulation_data)
+    else:
+        soa = build_soa(results_id, simulation_data)
+    
+    _plots_fragment(soa, summary, results_id)
+    _export_fragment(results)
+
+
+@fragment
+def _metrics_fragment(metadata, summary):
+    """Header metrics and control mode analysis
+
+    Only the metadata and summary are passed in, so the fragment holds no
+    reference to the per-day records between reruns. There is no run_every:
+    a loaded results file never changes, so polling would only redraw the
+    same numbers.
+    """
     # Header metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Target Y", f"{metadata['target_Y']:.3f}")
-    with col2:
-        final_y = summary['final_state']['Y']
-        delta = final_y - metadata['target_Y']
-        st.metric("Final Y", f"{final_y:.3f}", f"{delta:+.3f}")
-    with col3:
-        st.metric("Days Above Target", f"{summary['days_above_target']}/{metadata['horizon_days']}")
-    with col4:
-        achieved = "✅" if summary['target_achieved'] else "❌"
-        st.metric("Target Achieved", achieved)
+    final_y = summary['final_state']['Y']
+    delta = final_y - metadata['target_Y']
+    _metric_row([
+        ("Target Y", f"{metadata['target_Y']:.3f}", None),
+        ("Final Y", f"{final_y:.3f}", f"{delta:+.3f}"),
+        ("Days Above Target", f"{summary['days_above_target']}/{metadata['horizon_days']}", None),
+        ("Target Achieved", "✅" if summary['target_achieved'] else "❌", None),
+    ])
     
     # Control mode analysis (new feature)
     if 'control_mode_usage' in summary:
         st.subheader("🔄 Control Mode Analysis")
-        col1, col2, col3 = st.columns(3)
         
         precision_days = summary['control_mode_usage']['precision_days']
         fluctuation_days = summary['control_mode_usage']['fluctuation_days']
         total_days = metadata['horizon_days']
         
-        with col1:
-            st.metric("Precision Mode [P]", f"{precision_days} days", f"{precision_days/total_days*100:.1f}%")
-        with col2:
-            st.metric("Fluctuation Mode [F]", f"{fluctuation_days} days", f"{fluctuation_days/total_days*100:.1f}%")
-        with col3:
-            st.metric("Fluctuation Pulses", summary.get('total_fluctuation_pulses', 0))
-    
-    # Convert to DataFrame for plotting
-    df = pd.DataFrame(simulation_data)
-    
+        _metric_row([
+            ("Precision Mode [P]", f"{precision_days} days", f"{precision_days/total_days*100:.1f}%"),
+            ("Fluctuation Mode [F]", f"{fluctuation_days} days", f"{fluctuation_days/total_days*100:.1f}%"),
+            ("Fluctuation Pulses", summary.get('total_fluctuation_pulses', 0), None),
+        ])
+
+
+def _metric_row(metrics):
+    """Render (label, value, delta) metrics side by side in one columns call"""
+    for column, (label, value, delta) in zip(st.columns(len(metrics)), metrics):
+        column.metric(label, value, delta)
+
+
+@fragment
+def _plots_fragment(soa, summary, results_id=None):
+    """State, control and arm usage plots"""
     # Debug info
-    st.write(f"**Debug**: DataFrame shape: {df.shape}")
-    if not df.empty:
-        st.write(f"**Debug**: Columns: {list(df.columns)}")
-        st.write(f"**Debug**: First row keys: {list(df.iloc[0].keys()) if len(df) > 0 else 'No data'}")
-    
-    # State evolution plot
-    st.subheader("📊 State Evolution Over Time")
-    fig = create_state_evolution_plot(df)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Control actions plot
-    st.subheader("🎛️ Control Actions")
-    fig = create_control_actions_plot(df)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Control mode timeline (new)
-    if 'control_mode' in df.columns:
-        st.subheader("⏱️ Control Mode Timeline")
-        fig = create_control_timeline_plot(df)
-        st.plotly_chart(fig, use_container_width=True)
+    st.write(f"**Debug**: Data shape: ({len(soa['day'])}, {len(soa)})")
+    if len(soa['day']):
+        st.write(f"**Debug**: Columns: {list(soa)}")
+    
+    # State evolution, control actions and control mode timeline (one figure)
+    st.subheader("📊 State & Control Over Time")
+    if results_id is None:
+        fig = create_dashboard_figure(soa)
+    else:
+        fig = dashboard_figure(results_id, soa)
+    st.plotly_chart(fig, use_container_width=True, theme=None, config=PLOTLY_CONFIG,
+                    key="dashboard_main")
     
     # Arm usage
     st.subheader("🎯 Intervention Strategy Usage")
-    fig = create_arm_usage_plot(summary['arm_usage'])
-    st.plotly_chart(fig, use_container_width=True)
-    
+    components.html(arm_usage_html(summary['arm_usage']), height=ARM_USAGE_HEIGHT + 20)
+
+
+@fragment
+def _export_fragment(results):
+    """Report, CSV download and summary buttons"""
     # Export and interpretation section
     st.subheader("📄 Export & Analysis")
     col1, col2, col3 = st.columns(3)
@@ -160,8 +337,8 @@ def display_simulation_results(results):
             st.download_button(
                 label="⬇️ Download CSV",
                 data=csv_data,
-                file_name=f"cfar_simulation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                file_name=f"cfar_simulation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                mime="application/gzip"
             )
     
     with col3:
@@ -170,143 +347,228 @@ def display_simulation_results(results):
             st.text_area("Summary (copy this):", summary_text, height=200)
 
 
-def create_state_evolution_plot(df):
-    """Create interactive state evolution plot"""
-    fig = go.Figure()
+@st.cache_data(max_entries=32, show_spinner=False)
+def dashboard_figure(results_id: str, _soa: dict):
+    """Dashboard figure for a results file (see create_dashboard_figure)
+
+    The column arrays are not hashed (the object-dtype arm names would hash by
+    pointer and never match); ``results_id`` identifies them.
+    """
+    return create_dashboard_figure(_soa)
+
+
+def create_dashboard_figure(soa):
+    """Create the state, control action and control mode panels as one figure
+
+    The panels are rows of a single subplot figure sharing the day axis, so
+    zooming one zooms them all and the page mounts one chart instead of three.
+    """
+    from plotly.subplots import make_subplots
+    
+    titles = ["CFAR Framework: State Variables Over Time",
+              "CFAR Framework: Control Actions Over Time"]
+    days = soa['day']
+    has_modes = 'control_control_mode' in soa and len(days) > 0
+    if has_modes:
+        titles.append("Control Mode Timeline (Orange lines = Fluctuation Pulses)")
+    rows = len(titles)
+    
+    fig = make_subplots(rows=rows, cols=1, shared_xaxes=True, subplot_titles=titles,
+                        vertical_spacing=0.08)
+    create_state_evolution_plot(fig, 1, days,
+                                {var: soa[f'state_{var}'] for var in 'YNACB' if f'state_{var}' in soa})
+    create_control_actions_plot(fig, 2, days,
+                                {var: _soa_column(soa, f'control_{var}') for var in ('uC', 'uA', 'uF')})
+    if has_modes:
+        create_control_timeline_plot(fig, 3, days, soa['control_control_mode'],
+                                     _soa_column(soa, 'control_uF'))
+    
+    fig.update_xaxes(title_text="Day", row=rows, col=1)
+    fig.update_layout(
+        height=350 * rows,
+        hovermode='x unified',
+        uirevision='constant',  # keep zoom/pan across reruns
+        datarevision=data_revision(days, soa.get('state_Y', days), _soa_column(soa, 'control_uF'))
+    )
+    
+    return fig
+
+
+def create_state_evolution_plot(fig, row, days, state_arrays):
+    """Add the state evolution traces to one row of the dashboard figure
+
+    Args:
+        fig: Subplot figure to draw into
+        row: Subplot row
+        days: Day numbers
+        state_arrays: State variable name ('Y', 'N', ...) -> values per day
+    """
+    import plotly.graph_objects as go
     
     state_vars = ['Y', 'N', 'A', 'C', 'B']
     colors = ['blue', 'green', 'orange', 'red', 'purple']
     
     for var, color in zip(state_vars, colors):
-        # Extract state values from nested structure
-        values = []
-        days = []
-        for _, row in df.iterrows():
-            if 'state' in row and isinstance(row['state'], dict) and var in row['state']:
-                values.append(row['state'][var])
-                days.append(row['day'])
-        
-        if values:  # Only add trace if we have data
-            fig.add_trace(go.Scatter(
-                x=days,
-                y=values,
+        if var in state_arrays and len(days):  # Only add trace if we have data
+            x, y = _downsample(days, state_arrays[var])
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=y,
                 mode='lines',
                 name=var,
                 line=dict(color=color, width=2)
-            ))
-    
-    fig.update_layout(
-        title="CFAR Framework: State Variables Over Time",
-        xaxis_title="Day",
-        yaxis_title="Value",
-        hovermode='x unified'
-    )
+            ), row=row, col=1)
     
-    return fig
+    fig.update_yaxes(title_text="Value", row=row, col=1)
 
 
-def create_control_actions_plot(df):
-    """Create control actions plot with fluctuation highlighting"""
-    fig = go.Figure()
-    
-    # Extract control data from nested structure
-    days = []
-    uC_values = []
-    uA_values = []
-    uF_values = []
-    pulse_days = []
-    pulse_values = []
-    
-    for _, row in df.iterrows():
-        if 'control' in row and isinstance(row['control'], dict):
-            days.append(row['day'])
-            uC_values.append(row['control'].get('uC', 0))
-            uA_values.append(row['control'].get('uA', 0))
-            uF_val = row['control'].get('uF', 0)
-            uF_values.append(uF_val)
-            
-            # Track fluctuation pulses
-            if uF_val > 0.01:
-                pulse_days.append(row['day'])
-                pulse_values.append(uF_val)
+def lttb_indices(x, y, n_out):
+    """Select points with Largest-Triangle-Three-Buckets downsampling
+
+    Args:
+        x: Monotonic x values
+        y: Series values
+        n_out: Number of points to keep (first and last are always kept)
+
+    Returns:
+        Sorted indices of the points that best preserve the visual shape
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    if TSDOWNSAMPLE_AVAILABLE:
+        return LTTBDownsampler().downsample(x, y, n_out=n_out)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # n_out - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        # Twice the triangle area between the previous pick, each candidate
+        # and the next bucket's centroid
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return indices
+
+
+def _downsample(x, y, n_out=MAX_PLOT_POINTS):
+    """Return (x, y) reduced to at most n_out points via LTTB"""
+    if len(x) <= n_out:
+        return x, y
+    idx = lttb_indices(x, y, n_out)
+    return x[idx], y[idx]
+
+
+def data_revision(*arrays) -> str:
+    """Content fingerprint for a figure's ``datarevision``
+
+    Plotly.react only re-diffs trace data when this changes, so it must differ
+    whenever the plotted values do (a length alone is not enough).
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _soa_column(soa, name):
+    """Return a column array, zero-filled if the results don't have it"""
+    if name in soa:
+        return soa[name]
+    return np.zeros(len(soa['day']))
+
+
+def create_control_actions_plot(fig, row, days, control_arrays):
+    """Add the control action traces, with fluctuation highlighting, to one row
+
+    Args:
+        fig: Subplot figure to draw into
+        row: Subplot row
+        days: Day numbers
+        control_arrays: 'uC', 'uA' and 'uF' -> control signal per day
+    """
+    import plotly.graph_objects as go
     
     # Add traces if we have data
-    if days:
+    if len(days):
+        uC_values = control_arrays['uC']
+        uA_values = control_arrays['uA']
+        uF_values = control_arrays['uF']
+        
         # PID Control
-        fig.add_trace(go.Scatter(
-            x=days,
-            y=uC_values,
+        x, y = _downsample(days, uC_values)
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
             mode='lines',
             name='Structural Control (uC)',
             line=dict(color='red', width=2)
-        ))
+        ), row=row, col=1)
         
         # Attention Control
-        fig.add_trace(go.Scatter(
-            x=days,
-            y=uA_values,
+        x, y = _downsample(days, uA_values)
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
             mode='lines',
             name='Attention Control (uA)',
             line=dict(color='blue', width=2)
-        ))
+        ), row=row, col=1)
         
         # Fluctuation Control
-        fig.add_trace(go.Scatter(
-            x=days,
-            y=uF_values,
+        x, y = _downsample(days, uF_values)
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
             mode='lines',
             name='Fluctuation Control (uF)',
             line=dict(color='purple', width=2)
-        ))
+        ), row=row, col=1)
         
         # Highlight fluctuation pulses
-        if pulse_days:
-            fig.add_trace(go.Scatter(
-                x=pulse_days,
-                y=pulse_values,
+        mask = uF_values > 0.01
+        if mask.any():
+            fig.add_trace(go.Scattergl(
+                x=days[mask],
+                y=uF_values[mask],
                 mode='markers',
                 name='Fluctuation Pulses',
                 marker=dict(color='orange', size=8)
-            ))
+            ), row=row, col=1)
     
-    fig.update_layout(
-        title="CFAR Framework: Control Actions Over Time",
-        xaxis_title="Day",
-        yaxis_title="Control Signal",
-        hovermode='x unified'
-    )
-    
-    return fig
+    fig.update_yaxes(title_text="Control Signal", row=row, col=1)
 
 
-def create_control_timeline_plot(df):
-    """Create control mode timeline visualization"""
-    fig = go.Figure()
-    
-    # Extract control mode data from nested structure
-    days = []
-    precision_y = []
-    fluctuation_y = []
-    pulse_days = []
-    
-    for _, row in df.iterrows():
-        if 'control' in row and isinstance(row['control'], dict):
-            days.append(row['day'])
-            control_mode = row['control'].get('control_mode', 'fluctuation')
-            
-            if control_mode == 'precision':
-                precision_y.append(1)
-                fluctuation_y.append(0)
-            else:
-                precision_y.append(0)
-                fluctuation_y.append(1)
-            
-            # Track fluctuation pulses
-            if row['control'].get('uF', 0) > 0.01:
-                pulse_days.append(row['day'])
-    
-    if days:  # Only create plot if we have data
-        fig.add_trace(go.Scatter(
+def create_control_timeline_plot(fig, row, days, control_modes, uF_values):
+    """Add the control mode timeline to one row of the dashboard figure
+
+    Args:
+        fig: Subplot figure to draw into
+        row: Subplot row
+        days: Day numbers
+        control_modes: 'precision' / 'fluctuation' per day (pd.Categorical)
+        uF_values: Fluctuation control per day (pulses are marked)
+    """
+    import plotly.graph_objects as go
+    
+    if len(days):  # Only create plot if we have data
+        # Compare the int8 category codes rather than the mode strings
+        codes = pd.Categorical(control_modes, categories=['precision', 'fluctuation']).codes
+        precision_y = (codes == 0).astype(np.int8)
+        fluctuation_y = (codes == 1).astype(np.int8)
+        pulse_days = days[uF_values > 0.01]
+        
+        fig.add_trace(go.Scattergl(
             x=days,
             y=precision_y,
             mode='lines',
@@ -314,9 +576,9 @@ def create_control_timeline_plot(df):
             name='Precision Mode [P]',
             line=dict(color='blue'),
             fillcolor='rgba(0,0,255,0.3)'
-        ))
+        ), row=row, col=1)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=days,
             y=fluctuation_y,
             mode='lines',
@@ -324,26 +586,29 @@ def create_control_timeline_plot(df):
             name='Fluctuation Mode [F]',
             line=dict(color='purple'),
             fillcolor='rgba(128,0,128,0.3)'
-        ))
+        ), row=row, col=1)
         
-        # Mark fluctuation pulses
-        if pulse_days:
-            for day in pulse_days:
-                fig.add_vline(x=day, line=dict(color='orange', dash='dash'), opacity=0.7)
-    
-    fig.update_layout(
-        title="Control Mode Timeline (Orange lines = Fluctuation Pulses)",
-        xaxis_title="Day",
-        yaxis_title="Mode Active",
-        yaxis=dict(tickmode='array', tickvals=[0, 1], ticktext=['Inactive', 'Active']),
-        hovermode='x unified'
-    )
-    
-    return fig
+        # Mark fluctuation pulses as one segmented trace (None breaks the line)
+        if len(pulse_days):
+            fig.add_trace(go.Scattergl(
+                x=np.repeat(pulse_days, 3),
+                y=[0, 1, None] * len(pulse_days),
+                mode='lines',
+                name='Fluctuation Pulses',
+                line=dict(color='orange', dash='dash'),
+                opacity=0.7,
+                showlegend=False,
+                hoverinfo='skip'
+            ), row=row, col=1)
+    
+    fig.update_yaxes(title_text="Mode Active", tickmode='array', tickvals=[0, 1],
+                     ticktext=['Inactive', 'Active'], row=row, col=1)
 
 
 def create_arm_usage_plot(arm_usage):
     """Create intervention arm usage plot"""
+    import plotly.graph_objects as go
+    
     arms = list(arm_usage.keys())
     counts = list(arm_usage.values())
     
@@ -351,42 +616,38 @@ def create_arm_usage_plot(arm_usage):
     fig.update_layout(
         title="Intervention Strategy Usage",
         xaxis_title="Strategy Type",
-        yaxis_title="Days Used"
+        yaxis_title="Days Used",
+        height=ARM_USAGE_HEIGHT
     )
     
     return fig
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def arm_usage_html(arm_usage):
+    """Serialize the static arm usage chart to an HTML snippet once per run summary
+
+    The chart has no hover or zoom, so it is embedded as plain HTML rather
+    than through st.plotly_chart, which re-encodes the figure every rerun.
+    plotly.js itself is loaded from the CDN.
+    """
+    return create_arm_usage_plot(arm_usage).to_html(
+        include_plotlyjs='cdn', full_html=False, config=STATIC_PLOTLY_CONFIG
+    )
+
+
 def run_example_simulation():
     """Run example simulation and display results"""
     with st.spinner("Running CFAR Framework simulation..."):
         try:
-            temp_output_path = Path("temp_simulation.json")
+            config_path = "engine/configs/littering.yml"
+            config = load_config(config_path, os.path.getmtime(config_path))
             
-            # Run CLI simulation with proper encoding handling
-            result = subprocess.run([
-                "python", "engine/cli.py", "run",
-                "--config", "engine/configs/littering.yml",
-                "--output", str(temp_output_path)
-            ], capture_output=True, text=True, cwd=Path.cwd(),
-               encoding='utf-8', errors='replace')
-            
-            if result.returncode == 0:
-                # Load and display results
-                with open(temp_output_path, 'r', encoding='utf-8') as f:
-                    results = json.load(f)
-                display_simulation_results(results)
-                
-                # Clean up
-                if temp_output_path.exists():
-                    temp_output_path.unlink()
-                st.success("✅ Simulation completed successfully!")
-            else:
-                st.error("❌ Simulation failed!")
-                if result.stderr:
-                    st.error(f"**Error details:**\n```\n{result.stderr}\n```")
-                if result.stdout:
-                    st.info(f"**Output:**\n```\n{result.stdout}\n```")
+            # Run the engine in-process
+            config_json = json.dumps(config, sort_keys=True)
+            results, results_id = simulate_config(config_json, config_file=config_path)
+            display_simulation_results(results, results_id)
+            st.success("✅ Simulation completed successfully!")
                 
         except Exception as e:
             st.error(f"❌ Error running simulation: {str(e)}")
@@ -394,6 +655,13 @@ def run_example_simulation():
             st.error(f"**Traceback:**\n```\n{traceback.format_exc()}\n```")
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def load_config(path: str, mtime: float) -> dict:
+    """Load a YAML config, re-read only when the file's mtime changes"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def show_configuration():
     """
     System configuration interface for editing simulation parameters
@@ -403,54 +671,60 @@ def show_configuration():
     # Load default config
     config_path = Path("engine/configs/littering.yml")
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(str(config_path), config_path.stat().st_mtime)
         
         st.subheader("📋 Current Configuration")
         
-        # Basic parameters
-        col1, col2 = st.columns(2)
-        with col1:
-            target_Y = st.slider("Target Y", 0.0, 1.0, config['target_Y'], 0.01)
-            horizon_days = st.number_input("Simulation Days", 1, 365, config['horizon_days'])
+        # Widgets live in a form so dragging a slider doesn't rerun the page;
+        # nothing is applied until the form is submitted
+        with st.form("config_form"):
+        
+            # Basic parameters
+            col1, col2 = st.columns(2)
+            with col1:
+                target_Y = st.slider("Target Y", 0.0, 1.0, config['target_Y'], 0.01)
+                horizon_days = st.number_input("Simulation Days", 1, 365, config['horizon_days'])
         
-        with col2:
-            reward_threshold = st.slider("Reward Threshold", 0.0, 1.0, config['reward_threshold'], 0.01)
+            with col2:
+                reward_threshold = st.slider("Reward Threshold", 0.0, 1.0, config['reward_threshold'], 0.01)
         
-        # Initial state
-        st.subheader("🎯 Initial System State")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            init_Y = st.slider("Initial Y", 0.0, 1.0, config['init_state']['Y'], 0.01)
-            init_N = st.slider("Initial N", 0.0, 1.0, config['init_state']['N'], 0.01)
-        with col2:
-            init_A = st.slider("Initial A", 0.0, 1.0, config['init_state']['A'], 0.01)
-            init_C = st.slider("Initial C", 0.0, 1.0, config['init_state']['C'], 0.01)
-        with col3:
-            init_B = st.slider("Initial B", 0.0, 1.0, config['init_state']['B'], 0.01)
+            # Initial state
+            st.subheader("🎯 Initial System State")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                init_Y = st.slider("Initial Y", 0.0, 1.0, config['init_state']['Y'], 0.01)
+                init_N = st.slider("Initial N", 0.0, 1.0, config['init_state']['N'], 0.01)
+            with col2:
+                init_A = st.slider("Initial A", 0.0, 1.0, config['init_state']['A'], 0.01)
+                init_C = st.slider("Initial C", 0.0, 1.0, config['init_state']['C'], 0.01)
+            with col3:
+                init_B = st.slider("Initial B", 0.0, 1.0, config['init_state']['B'], 0.01)
         
-        # PID parameters
-        st.subheader("🎛️ PID Controller")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            kp = st.slider("Proportional Gain", 0.0, 2.0, config['pid']['kp'], 0.1)
-            ki = st.slider("Integral Gain", 0.0, 1.0, config['pid']['ki'], 0.1)
-        with col2:
-            kd = st.slider("Derivative Gain", 0.0, 1.0, config['pid']['kd'], 0.1)
-            deadband = st.slider("Deadband", 0.0, 0.1, config['pid']['deadband'], 0.001)
-        with col3:
-            max_step = st.slider("Max Step", 0.0, 0.2, config['pid']['max_step'], 0.01)
-            hysteresis = st.slider("Hysteresis", 0.0, 0.1, config['pid']['hysteresis'], 0.001)
+            # PID parameters
+            st.subheader("🎛️ PID Controller")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                kp = st.slider("Proportional Gain", 0.0, 2.0, config['pid']['kp'], 0.1)
+                ki = st.slider("Integral Gain", 0.0, 1.0, config['pid']['ki'], 0.1)
+            with col2:
+                kd = st.slider("Derivative Gain", 0.0, 1.0, config['pid']['kd'], 0.1)
+                deadband = st.slider("Deadband", 0.0, 0.1, config['pid']['deadband'], 0.001)
+            with col3:
+                max_step = st.slider("Max Step", 0.0, 0.2, config['pid']['max_step'], 0.01)
+                hysteresis = st.slider("Hysteresis", 0.0, 0.1, config['pid']['hysteresis'], 0.001)
         
-        # Fluctuation controller
-        st.subheader("🌊 Fluctuation Controller")
-        col1, col2 = st.columns(2)
-        with col1:
-            max_uF = st.slider("Max uF", 0.0, 0.5, config['fluctuation']['max_uF'], 0.01)
-            cooldown_days = st.number_input("Cooldown Days", 1, 30, config['fluctuation']['cooldown_days'])
-        with col2:
-            A_threshold = st.slider("Attention Threshold", 0.0, 1.0, config['fluctuation']['A_threshold'], 0.01)
-            stall_threshold = st.slider("Stall Threshold", 0.0, 0.1, config['fluctuation']['stall_threshold'], 0.001)
+            # Fluctuation controller
+            st.subheader("🌊 Fluctuation Controller")
+            col1, col2 = st.columns(2)
+            with col1:
+                max_uF = st.slider("Max uF", 0.0, 0.5, config['fluctuation']['max_uF'], 0.01)
+                cooldown_days = st.number_input("Cooldown Days", 1, 30, config['fluctuation']['cooldown_days'])
+            with col2:
+                A_threshold = st.slider("Attention Threshold", 0.0, 1.0, config['fluctuation']['A_threshold'], 0.01)
+                stall_threshold = st.slider("Stall Threshold", 0.0, 0.1, config['fluctuation']['stall_threshold'], 0.001)
+            
+            # Run simulation button
+            submitted = st.form_submit_button("🚀 Run Simulation with Custom Config")
         
         # Create modified config
         modified_config = config.copy()
@@ -471,9 +745,11 @@ def show_configuration():
             }
         })
         
-        # Run simulation button
-        if st.button("🚀 Run Simulation with Custom Config"):
+        if submitted:
             run_custom_simulation(modified_config)
+        else:
+            # Compile the kernels while the user is still adjusting the form
+            warm_engine(config)
     else:
         st.error("❌ Configuration file not found")
 
@@ -488,17 +764,25 @@ def show_analytics():
     st.subheader("📁 Compare Simulation Runs")
     uploaded_files = st.file_uploader(
         "Upload multiple simulation results for comparison", 
-        type=['json'], 
+        type=['json', 'parquet'], 
         accept_multiple_files=True
     )
     
     if uploaded_files and len(uploaded_files) > 1:
-        # Load all results
+        # Load all results (Parquet files are already flat)
         all_results = []
-        for file in uploaded_files:
-            results = json.load(file)
-            results['filename'] = file.name
-            all_results.append(results)
+        run_frames = []
+        try:
+            for file in uploaded_files:
+                results, df, results_id = load_run(file)
+                results['filename'] = file.name
+                all_results.append(results)
+                # Long runs are reduced to MAX_PLOT_POINTS per trace before plotting
+                days, y = comparison_trace(results_id, df)
+                run_frames.append(pd.DataFrame({'day': days, 'state_Y': y, 'run': file.name}))
+        except ImportError as e:
+            st.error(f"❌ {e}")
+            return
         
         # Comparison metrics
         st.subheader("📊 Comparison Metrics")
@@ -518,33 +802,15 @@ def show_analytics():
                 'Fluctuation Pulses': results['summary'].get('total_fluctuation_pulses', 0)
             })
         
-        df_comparison = pd.DataFrame(comparison_data)
-        st.dataframe(df_comparison)
+        st.dataframe(comparison_table(comparison_data))
         
         # Comparative plots
         st.subheader("📈 Comparative Analysis")
         
-        # Performance comparison
-        fig = go.Figure()
-        for i, results in enumerate(all_results):
-            sim_data = pd.DataFrame(results['simulation_data'])
-            y_values = [day['state']['Y'] for day in sim_data.to_dict('records')]
-            
-            fig.add_trace(go.Scatter(
-                x=sim_data['day'],
-                y=y_values,
-                mode='lines',
-                name=results['filename'],
-                line=dict(width=2)
-            ))
-        
-        fig.update_layout(
-            title="Performance Comparison: Y Over Time",
-            xaxis_title="Day",
-            yaxis_title="Y Value",
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        # Performance comparison: one long frame, one WebGL trace per run
+        fig = create_comparison_figure(pd.concat(run_frames, ignore_index=True))
+        st.plotly_chart(fig, use_container_width=True, theme=None, config=PLOTLY_CONFIG,
+                        key="analytics_main")
         
     elif uploaded_files and len(uploaded_files) == 1:
         st.info("Upload at least 2 files for comparison analysis")
@@ -552,51 +818,107 @@ def show_analytics():
         st.info("Upload simulation result files to compare performance")
 
 
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def comparison_table(comparison_data: list):
+    """Comparison rows as an Arrow table, built once per set of runs
+
+    st.dataframe ships Arrow to the browser, so handing it a Table skips the
+    DataFrame-to-Arrow conversion on reruns. Falls back to a DataFrame
+    without pyarrow.
+    """
+    if PYARROW_AVAILABLE:
+        return pa.Table.from_pylist(comparison_data)
+    return pd.DataFrame(comparison_data)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_comparison_figure(long_df):
+    """Create the Y-over-time comparison figure, one WebGL trace per run
+
+    Args:
+        long_df: Downsampled 'day', 'state_Y' and 'run' columns for all runs
+    """
+    import plotly.express as px
+    
+    fig = px.line(long_df, x='day', y='state_Y', color='run', render_mode='webgl')
+    fig.update_traces(line=dict(width=2))
+    
+    fig.update_layout(
+        title="Performance Comparison: Y Over Time",
+        xaxis_title="Day",
+        yaxis_title="Y Value",
+        hovermode='x unified',
+        uirevision='constant',  # keep zoom/pan across reruns
+        datarevision=data_revision(long_df['day'].to_numpy(), long_df['state_Y'].to_numpy(),
+                                   long_df['run'].to_numpy().astype(str))
+    )
+    
+    return fig
+
+
+@st.cache_resource(show_spinner="Compiling simulation kernels...")
+def warm_engine(_config: dict) -> bool:
+    """Run a two-day simulation once per server process
+
+    The first run in a fresh process pays for numba compiling the engine
+    kernels (seconds when there is no on-disk cache). Doing it here, once,
+    keeps that out of the first real run. Controllers themselves are not
+    cached: they are stateful per run and cheap to build.
+    """
+    if NUMBA_AVAILABLE:
+        run_config(dict(_config, horizon_days=2), quiet=True)
+    return True
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def simulate_config(config_json: str, config_file: str = None) -> tuple:
+    """Run the engine in-process on a serialized config and return the results
+
+    Memoized on the config text, so reruns with unchanged settings skip the
+    engine entirely (exceptions are never cached).
+
+    Returns:
+        (results, results id). The id hashes the per-day records, not the
+        config: an unseeded config evicted from this cache reruns to different
+        data, which must not pick up the old run's cached columns and figure.
+    """
+    results = run_config(json.loads(config_json), quiet=True, config_file=config_file)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(results['simulation_data'], option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(results['simulation_data'])
+    return results, results_key(data)
+
+
 def run_custom_simulation(config):
     """Run simulation with custom configuration"""
     with st.spinner("Running custom simulation..."):
         try:
-            # Save temporary config
-            temp_config_path = Path("temp_config.yml")
-            temp_output_path = Path("temp_custom_simulation.json")
-            
-            with open(temp_config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            config_json = json.dumps(config, sort_keys=True)
+            results, results_id = simulate_config(config_json)
             
-            # Run simulation with proper encoding handling
-            result = subprocess.run([
-                "python", "engine/cli.py", "run",
-                "--config", str(temp_config_path),
-                "--output", str(temp_output_path)
-            ], capture_output=True, text=True, cwd=Path.cwd(), 
-               encoding='utf-8', errors='replace')
-            
-            if result.returncode == 0:
-                # Load and display results
-                with open(temp_output_path, 'r', encoding='utf-8') as f:
-                    results = json.load(f)
-                
-                st.success("✅ Custom simulation completed!")
-                display_simulation_results(results)
-                
-                # Cleanup
-                if temp_config_path.exists():
-                    temp_config_path.unlink()
-                if temp_output_path.exists():
-                    temp_output_path.unlink()
-            else:
-                st.error("❌ Simulation failed!")
-                if result.stderr:
-                    st.error(f"**Error details:**\n```\n{result.stderr}\n```")
-                if result.stdout:
-                    st.info(f"**Output:**\n```\n{result.stdout}\n```")
-                
+            st.success("✅ Custom simulation completed!")
+            display_simulation_results(results, results_id)
+        
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
             import traceback
             st.error(f"**Traceback:**\n```\n{traceback.format_exc()}\n```")
 
 
+@st.cache_data(ttl="1h", max_entries=64, show_spinner=False)
+def load_doc(path: str, mtime: float) -> str:
+    """Read a markdown document, re-read only when the file's mtime changes"""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@st.cache_data(ttl="1h", max_entries=64, show_spinner=False)
+def render_doc(path: str, mtime: float) -> str:
+    """Render a markdown document to HTML once per file change (needs markdown-it-py)"""
+    md = MarkdownIt("commonmark", {"html": False}).enable("table")
+    return md.render(load_doc(path, mtime))
+
+
 def show_documentation():
     """
     Documentation viewer
@@ -631,6 +953,20 @@ def show_documentation():
     See `/theory/` directory for detailed mathematical foundations.
     """)
     
+    st.subheader("📖 Read the Docs")
+    doc_paths = {f"{path.parent.name}/{path.name}": path
+                 for doc_dir in DOC_DIRS for path in sorted(doc_dir.glob("*.md"))}
+    if doc_paths:
+        choice = st.selectbox("Document", list(doc_paths))
+        path = doc_paths[choice]
+        mtime = path.stat().st_mtime
+        if MARKDOWN_IT_AVAILABLE:
+            st.html(render_doc(str(path), mtime))
+        else:
+            st.markdown(load_doc(str(path), mtime))
+    else:
+        st.info("No documentation files found")
+    
     st.subheader("🔗 Available Resources")
     st.markdown("""
     - [Theory Documentation](/docs/theory/)
@@ -641,59 +977,47 @@ def show_documentation():
     """)
 
 
-def generate_detailed_report(results):
-    """Generate and display detailed interpretive report"""
-    
-    # Quick analysis
-    metadata = results['metadata']
-    summary = results['summary']
-    
-    st.subheader("🔍 Interpretive Analysis")
-    
+@st.cache_data(max_entries=64, show_spinner=False)
+def _compute_insights(summary: dict, metadata: dict) -> dict:
+    """Derive the interpretive report's figures, insights and recommendations
+
+    Pure arithmetic on the run summary, memoized so button and fragment reruns
+    only redraw the report.
+
+    Args:
+        summary: Results summary
+        metadata: Results metadata
+
+    Returns:
+        Dictionary of report values plus 'insights' and 'recommendations' lists
+    """
     # Performance analysis
     final_Y = summary['final_state']['Y']
     target_Y = metadata['target_Y']
     performance_ratio = final_Y / target_Y
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric("Performance Ratio", f"{performance_ratio:.1%}", 
-                 f"{(final_Y - target_Y)*100:+.1f}pp vs target")
-        
-        # Performance grade
-        if performance_ratio >= 0.95:
-            grade = "A"
-            grade_color = "🟢"
-        elif performance_ratio >= 0.85:
-            grade = "B" 
-            grade_color = "🟡"
-        elif performance_ratio >= 0.75:
-            grade = "C"
-            grade_color = "🟠"
-        else:
-            grade = "D"
-            grade_color = "🔴"
-        
-        st.metric("Performance Grade", f"{grade_color} {grade}")
-    
-    with col2:
-        # Control strategy analysis
-        if 'control_mode_usage' in summary:
-            precision_pct = summary['control_mode_usage']['precision_days'] / metadata['horizon_days'] * 100
-            fluctuation_pct = summary['control_mode_usage']['fluctuation_days'] / metadata['horizon_days'] * 100
-            
-            st.metric("Control Strategy", 
-                     "Precision-Capable" if precision_pct > 50 else "Fluctuation-Reliant",
-                     f"{precision_pct:.0f}% precision mode")
-            
-            pulse_count = summary.get('total_fluctuation_pulses', 0)
-            pulse_frequency = pulse_count / metadata['horizon_days'] * 100
-            st.metric("Gradient Engineering", f"{pulse_count} pulses", 
-                     f"{pulse_frequency:.1f} per 100 days")
-    
-    # Key insights
-    st.subheader("💡 Key Insights")
+    # Performance grade
+    if performance_ratio >= 0.95:
+        grade = "A"
+        grade_color = "🟢"
+    elif performance_ratio >= 0.85:
+        grade = "B" 
+        grade_color = "🟡"
+    elif performance_ratio >= 0.75:
+        grade = "C"
+        grade_color = "🟠"
+    else:
+        grade = "D"
+        grade_color = "🔴"
+    
+    # Control strategy analysis
+    has_modes = 'control_mode_usage' in summary
+    precision_pct = fluctuation_pct = 0.0
+    if has_modes:
+        precision_pct = summary['control_mode_usage']['precision_days'] / metadata['horizon_days'] * 100
+        fluctuation_pct = summary['control_mode_usage']['fluctuation_days'] / metadata['horizon_days'] * 100
+    pulse_count = summary.get('total_fluctuation_pulses', 0)
+    pulse_frequency = pulse_count / metadata['horizon_days'] * 100
     
     insights = []
     
@@ -705,7 +1029,7 @@ def generate_detailed_report(results):
         insights.append(f"⚠️ **Performance Gap**: System fell short of target by {gap:.1%}.")
     
     # Control insights
-    if 'control_mode_usage' in summary:
+    if has_modes:
         if fluctuation_pct > 80:
             insights.append(f"🌊 **Resolution-Limited**: System operated in fluctuation mode {fluctuation_pct:.0f}% of the time, indicating frequent resolution limits.")
         elif precision_pct > 60:
@@ -717,13 +1041,6 @@ def generate_detailed_report(results):
     elif pulse_count < 3:
         insights.append("🔄 **Minimal Fluctuation**: Few gradient engineering interventions suggests either good precision or insufficient fluctuation sensitivity.")
     
-    # Display insights
-    for insight in insights:
-        st.info(insight)
-    
-    # Recommendations
-    st.subheader("🎯 Recommendations")
-    
     recommendations = []
     
     if performance_ratio < 0.9:
@@ -738,38 +1055,72 @@ def generate_detailed_report(results):
     if pulse_count > 20:
         recommendations.append("💡 **Attention Management**: High fluctuation activity suggests potential attention allocation optimization opportunities.")
     
-    # Display recommendations
-    for rec in recommendations:
+    return {
+        'final_Y': final_Y,
+        'target_Y': target_Y,
+        'performance_ratio': performance_ratio,
+        'grade': grade,
+        'grade_color': grade_color,
+        'has_modes': has_modes,
+        'precision_pct': precision_pct,
+        'fluctuation_pct': fluctuation_pct,
+        'pulse_count': pulse_count,
+        'pulse_frequency': pulse_frequency,
+        'insights': insights,
+        'recommendations': recommendations
+    }
+
+
+def generate_detailed_report(results):
+    """Generate and display detailed interpretive report"""
+    
+    # Quick analysis
+    report = _compute_insights(results['summary'], results['metadata'])
+    
+    st.subheader("🔍 Interpretive Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric("Performance Ratio", f"{report['performance_ratio']:.1%}", 
+                 f"{(report['final_Y'] - report['target_Y'])*100:+.1f}pp vs target")
+        st.metric("Performance Grade", f"{report['grade_color']} {report['grade']}")
+    
+    with col2:
+        # Control strategy analysis
+        if report['has_modes']:
+            st.metric("Control Strategy", 
+                     "Precision-Capable" if report['precision_pct'] > 50 else "Fluctuation-Reliant",
+                     f"{report['precision_pct']:.0f}% precision mode")
+            st.metric("Gradient Engineering", f"{report['pulse_count']} pulses", 
+                     f"{report['pulse_frequency']:.1f} per 100 days")
+    
+    # Key insights
+    st.subheader("💡 Key Insights")
+    for insight in report['insights']:
+        st.info(insight)
+    
+    # Recommendations
+    st.subheader("🎯 Recommendations")
+    for rec in report['recommendations']:
         st.success(rec)
 
 
 def export_csv_data(results):
-    """Export simulation data as CSV"""
-    
-    # Flatten nested data structure
-    flattened_data = []
+    """Export simulation data as gzip-compressed UTF-8 CSV bytes"""
     
-    for day_data in results['simulation_data']:
-        row = {'day': day_data['day']}
-        
-        # Add state variables
-        for var in ['Y', 'N', 'A', 'C', 'B']:
-            row[f'state_{var}'] = day_data['state'][var]
-        
-        # Add control variables  
-        for var in ['uC', 'uA', 'uF', 'control_mode', 'arm_name']:
-            row[f'control_{var}'] = day_data['control'][var]
-        
-        # Add parameters
-        for var in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']:
-            row[f'param_{var}'] = day_data['parameters'][var]
-        
-        flattened_data.append(row)
+    # Pick the export columns straight from the column arrays
+    soa = to_soa(results['simulation_data'])
+    columns = {'day': soa['day']}
+    columns.update({f'state_{var}': soa[f'state_{var}'] for var in ['Y', 'N', 'A', 'C', 'B']})
+    columns.update({f'control_{var}': soa[f'control_{var}'] for var in ['uC', 'uA', 'uF', 'control_mode', 'arm_name']})
+    columns.update({f'param_{var}': soa[f'parameters_{var}'] for var in ['NA_eff', 'lambda_eff', 'k1', 'delta_Y_min']})
     
-    # Create CSV
-    df = pd.DataFrame(flattened_data)
-    csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, index=False)
+    # Create gzipped CSV, encoded and compressed by pandas straight into a bytes buffer
+    df = pd.DataFrame(columns)
+    csv_buffer = io.BytesIO()
+    df.to_csv(csv_buffer, index=False, encoding='utf-8',
+              compression={'method': 'gzip', 'compresslevel': 1})
     
     return csv_buffer.getvalue()
 
@@ -777,14 +1128,19 @@ def export_csv_data(results):
 def generate_summary_text(results):
     """Generate a text summary for copying/sharing"""
     
-    metadata = results['metadata']
-    summary = results['summary']
-    
-    summary_text = f"""
+    header = f"""
 CFAR Framework Simulation Summary
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-CONFIGURATION:
+"""
+    return header + _build_summary_text(results['summary'], results['metadata'])
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_summary_text(summary: dict, metadata: dict) -> str:
+    """Summary text body (everything below the timestamp), memoized per run"""
+    
+    summary_text = f"""CONFIGURATION:
 • Target Performance: {metadata['target_Y']:.1%}
 • Simulation Period: {metadata['horizon_days']} days
 • Initial State: Y={metadata['initial_state']['Y']:.1%}
@@ -837,5 +1193,14 @@ Generated by CFAR Framework Dashboard
     return summary_text
 
 
+# Sidebar page name -> view function (in menu order)
+PAGES = {
+    "Dashboard": show_dashboard,
+    "System Configuration": show_configuration,
+    "Performance Analytics": show_analytics,
+    "Documentation": show_documentation,
+}
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file